@@ -125,6 +125,12 @@ class Backend(Protocol):
         version: str = "1.0",
     ) -> ResourceTemplateRef: ...
 
+    def add_child_resource_templates(
+        self,
+        children: list[dict[str, Any]],
+        parent_resource_template: ResourceTemplateRef | ResourceTemplateSchema,
+    ) -> list[str]: ...
+
     @overload
     def get_resource_template(
         self,
@@ -225,3 +231,9 @@ class Backend(Protocol):
         process_run: ProcessRunSchema,
         child_step: StepSchema,
     ) -> StepSchema: ...
+
+    def add_child_steps(
+        self,
+        process_run: ProcessRunSchema,
+        child_steps: list[StepSchema],
+    ) -> list[StepSchema]: ...
@@ -2,7 +2,7 @@ import json
 import warnings
 from contextlib import contextmanager
 from typing import Any, Literal
-from uuid import UUID
+from uuid import UUID, uuid4
 
 from pydantic import BaseModel, Field, create_model
 from sqlalchemy import Float, Integer, Select, String, cast, insert, select
@@ -14,6 +14,9 @@ from sqlalchemy.sql.functions import count
 from recap.adapter import Backend, UnitOfWork
 from recap.adapter.process_run_construct import ProcessRunSchemaHydrator
 from recap.adapter.query_loaders import (
+    PROCESS_TEMPLATE_INIT_LOADERS,
+    RESOURCE_TEMPLATE_INIT_LOADERS,
+    STEP_TEMPLATE_INIT_LOADERS,
     preload_options,
     resolve_loader_options,
 )
@@ -34,6 +37,7 @@ from recap.db.resource import (
     Resource,
     ResourceTemplate,
     ResourceType,
+    _descendant_templates_cte,
     resource_template_type_association,
 )
 from recap.db.step import Parameter, Step, StepTemplate, StepTemplateResourceSlotBinding
@@ -81,6 +85,33 @@ SCHEMA_MODEL_MAPPING: dict[type[BaseModel], type[Base]] = {
 }
 
 
+def _property_row_shapes(
+    properties: dict[str, list[Any]],
+) -> list[tuple[str, str, list[dict[str, Any]]]]:
+    """Expand validated property groups into ``(name, slug, attribute rows)``
+    for bulk inserts; the attribute rows lack ``id`` and group id."""
+    return [
+        (
+            group_name,
+            make_slug(group_name),
+            [
+                {
+                    "name": attr.name,
+                    "slug": make_slug(attr.name),
+                    "value_type": attr.type,
+                    "unit": attr.unit,
+                    "default_value": json.dumps(attr.default, default=str)
+                    if isinstance(attr.default, list)
+                    else attr.default,
+                    "metadata_json": attr.metadata or {},
+                }
+                for attr in attrs
+            ],
+        )
+        for group_name, attrs in properties.items()
+    ]
+
+
 class SQLUnitOfWork(UnitOfWork):
     def __init__(self, backend: "LocalBackend", session: Session, tx):
         self._backend = backend
@@ -435,6 +466,93 @@ class LocalBackend(Backend):
         self.session.flush()
         return ResourceTemplateRef.model_validate(template)
 
+    def add_child_resource_templates(
+        self,
+        children: list[dict[str, Any]],
+        parent_resource_template: ResourceTemplateRef | ResourceTemplateSchema,
+    ) -> list[str]:
+        """
+        Insert many child templates, with their property groups and
+        attributes, under one parent using one executemany per table
+        - Each child is a dict with ``name``, ``version``, ``types`` (a list of
+          ResourceTypeSchema) and ``properties`` (group name -> list of
+          AttributeTemplateValidator)
+        - ORM events do not fire, so slugs are set here
+        - Children whose name and version already exist under the parent, or
+          repeat an earlier child in the batch, are left untouched; their
+          names are returned
+        """
+        parent_template = self.session.get(
+            ResourceTemplate, parent_resource_template.id
+        )
+        if parent_template is None:
+            raise NoResultFound(
+                f"Parent template: {parent_resource_template.name} with id {parent_resource_template.id} not found"
+            )
+        existing = set(
+            self.session.execute(
+                select(ResourceTemplate.name, ResourceTemplate.version).where(
+                    ResourceTemplate.parent_id == parent_template.id
+                )
+            ).tuples()
+        )
+
+        # Children usually share one properties mapping; expand it into group
+        # and attribute rows once and copy those per child
+        shapes: dict[int, tuple[dict, list[tuple[str, str, list[dict]]]]] = {}
+        template_rows: list[dict] = []
+        type_rows: list[dict] = []
+        group_rows: list[dict] = []
+        attribute_rows: list[dict] = []
+        skipped: list[str] = []
+        for child in children:
+            if (child["name"], child["version"]) in existing:
+                skipped.append(child["name"])
+                continue
+            existing.add((child["name"], child["version"]))
+            template_id = uuid4()
+            template_rows.append(
+                {
+                    "id": template_id,
+                    "name": child["name"],
+                    "slug": make_slug(child["name"]),
+                    "version": child["version"],
+                    "parent_id": parent_template.id,
+                }
+            )
+            type_rows.extend(
+                {"resource_template_id": template_id, "resource_type_id": rt.id}
+                for rt in child["types"]
+            )
+            props = child["properties"]
+            if id(props) not in shapes:
+                shapes[id(props)] = (props, _property_row_shapes(props))
+            for group_name, group_slug, attr_shape in shapes[id(props)][1]:
+                group_id = uuid4()
+                group_rows.append(
+                    {
+                        "id": group_id,
+                        "name": group_name,
+                        "slug": group_slug,
+                        "resource_template_id": template_id,
+                    }
+                )
+                attribute_rows.extend(
+                    {**attr_row, "id": uuid4(), "attribute_group_template_id": group_id}
+                    for attr_row in attr_shape
+                )
+
+        for table, rows in (
+            (ResourceTemplate, template_rows),
+            (resource_template_type_association, type_rows),
+            (AttributeGroupTemplate, group_rows),
+            (AttributeTemplate, attribute_rows),
+        ):
+            if rows:
+                self.session.execute(insert(table), rows)
+        self.session.expire(parent_template, ["children"])
+        return skipped
+
     def add_child_resources(
         self,
         parent_resource: ResourceSchema | ResourceRef,
@@ -519,7 +637,6 @@ class LocalBackend(Backend):
         on_existing: Literal["create", "silent", "warn", "raise"] = "create",
     ) -> ResourceRef | ResourceSchema:
         parent_id = parent_resource.id if parent_resource else None
-        template_model = self.session.get(ResourceTemplate, resource_template.id)
 
         if on_existing != "create":
             matches = self.find_resources_by_identity(
@@ -540,36 +657,80 @@ class LocalBackend(Backend):
                     return ResourceSchema.model_validate(existing)
                 return ResourceRef.model_validate(existing)
 
-        resource = Resource(
-            name=name,
-            resource_template_id=resource_template.id,
-            parent_id=parent_id,
-            template=template_model,
-        )
-
         # Guard against the DB UNIQUE constraint on (parent_id, name).
         # This is a broader check than find_resources_by_identity (which also
         # filters by template_id) — two children under the same parent cannot
-        # share a name regardless of template.
+        # share a name regardless of template.  Checked before the template
+        # tree is loaded so a rejected name costs a single query.
         if parent_id is not None:
-            dup = self.session.scalars(
-                select(Resource).where(
+            dup = self.session.scalar(
+                select(Resource.id).where(
                     Resource.parent_id == parent_id,
                     Resource.name == name,
                 )
-            ).first()
+            )
             if dup is not None:
                 raise ValidationError(
                     "name",
                     f"Resource {name!r} already exists under parent {parent_id!r}",
                 )
 
+        template_model = self._load_resource_template_tree(resource_template.id)
+        resource = Resource(
+            name=name,
+            resource_template_id=resource_template.id,
+            parent_id=parent_id,
+            template=template_model,
+        )
         self.session.add(resource)
         self.session.flush()
         if expand:
-            return ResourceSchema.model_validate(resource)
+            return self._construct_resource(resource)
         return ResourceRef.model_validate(resource)
 
+    @staticmethod
+    def _construct_resource(resource: Resource) -> ResourceSchema:
+        """Build the full schema for a resource this backend just wrote.
+
+        The rows are trusted, so go through the ``model_construct`` hydrator
+        rather than re-validating the whole tree with ``model_validate``.
+        """
+        return ResourceSchemaHydrator().construct_many(
+            [resource],
+            include_template=True,
+            include_properties=True,
+            include_children=True,
+            full=True,
+            on_unloaded="warn",
+        )[0]
+
+    @staticmethod
+    def _construct_process_run(process_run: ProcessRun) -> ProcessRunSchema:
+        """Process-run counterpart of :meth:`_construct_resource`."""
+        return ProcessRunSchemaHydrator().construct_many(
+            [process_run],
+            include_steps=True,
+            include_step_parameters=True,
+            include_resources=True,
+            full=True,
+            on_unloaded="warn",
+        )[0]
+
+    def _load_resource_template_tree(
+        self, template_id: UUID
+    ) -> ResourceTemplate | None:
+        """Load a template and all of its descendants in one query, with the
+        relationships Resource.__init__ walks eager-loaded, so instantiating a
+        resource from it costs a fixed number of statements."""
+        cte = _descendant_templates_cte(template_id)
+        stmt = (
+            select(ResourceTemplate)
+            .where(ResourceTemplate.id.in_(select(cte.c.id)))
+            .options(*RESOURCE_TEMPLATE_INIT_LOADERS)
+        )
+        templates = {t.id: t for t in self.session.scalars(stmt)}
+        return templates.get(template_id)
+
     def get_resource(
         self,
         name: str,
@@ -618,8 +779,10 @@ class LocalBackend(Backend):
         process_template: ProcessTemplateRef | ProcessTemplateSchema,
         campaign: CampaignSchema,
     ) -> ProcessRunSchema:
-        statement = select(ProcessTemplate).where(
-            ProcessTemplate.id == process_template.id
+        statement = (
+            select(ProcessTemplate)
+            .where(ProcessTemplate.id == process_template.id)
+            .options(*PROCESS_TEMPLATE_INIT_LOADERS)
         )
         process_template_model = load_single(
             self.session, statement, label="ProcessTemplate"
@@ -632,7 +795,7 @@ class LocalBackend(Backend):
         )
         self.session.add(process_run)
         self.session.flush()
-        return ProcessRunSchema.model_validate(process_run)
+        return self._construct_process_run(process_run)
 
     def assign_resource(
         self,
@@ -702,7 +865,7 @@ class LocalBackend(Backend):
                 f"to slot {resource_slot_model.name!r}: {exc}"
             ) from exc
 
-        return ProcessRunSchema.model_validate(process_run_model)
+        return self._construct_process_run(process_run_model)
 
     def check_resource_assignment(
         self,
@@ -743,7 +906,7 @@ class LocalBackend(Backend):
             )
         )
         steps = self.session.scalars(statement).all()
-        return [StepSchema.model_validate(step) for step in steps]
+        return StepSchema.validate_list(steps)
 
     def get_params(self, step_schema: StepSchema) -> type[BaseModel]:
         statement = select(Step).where(
@@ -778,8 +941,9 @@ class LocalBackend(Backend):
             params[param.template.slug] = (
                 values_model,
                 Field(
-                    default_factory=lambda vm=values_model,
-                    values=raw_values: vm.model_validate(values),
+                    default_factory=lambda vm=values_model, values=raw_values: (
+                        vm.model_validate(values)
+                    ),
                     alias=param.template.name,
                 ),
             )
@@ -807,9 +971,18 @@ class LocalBackend(Backend):
         # Flush so that _reload_process_run sees the updated values
         self.session.flush()
 
-    def add_child_step(  # noqa
+    def add_child_step(
         self, process_run: ProcessRunSchema, child_step: StepSchema
     ) -> StepSchema:
+        return self.add_child_steps(process_run, [child_step])[0]
+
+    def add_child_steps(  # noqa
+        self, process_run: ProcessRunSchema, child_steps: list[StepSchema]
+    ) -> list[StepSchema]:
+        """
+        Add child steps to a process run, loading the run and the step
+        templates once and flushing once for the whole batch
+        """
         pr_model = load_single(
             self.session,
             select(ProcessRun)
@@ -834,69 +1007,81 @@ class LocalBackend(Backend):
             label="ProcessRun",
         )
 
-        parent_step = next(
-            (s for s in pr_model.steps.values() if s.id == child_step.parent_id), None
-        )
-        if parent_step is None:
-            raise ValueError(
-                f"Parent step with id {child_step.parent_id} not found in run {pr_model.name}"
+        steps_by_id = {s.id: s for s in pr_model.steps.values()}
+        template_ids = {child_step.template.id for child_step in child_steps}
+        templates = {
+            t.id: t
+            for t in self.session.scalars(
+                select(StepTemplate)
+                .where(
+                    StepTemplate.process_template_id == pr_model.process_template_id,
+                    StepTemplate.id.in_(template_ids),
+                )
+                .options(
+                    chain_load(
+                        StepTemplate.bindings,
+                        StepTemplateResourceSlotBinding.resource_slot,
+                    ),
+                    *STEP_TEMPLATE_INIT_LOADERS,
+                )
             )
+        }
 
-        template = load_single(
-            self.session,
-            select(StepTemplate)
-            .where(
-                StepTemplate.process_template_id == pr_model.process_template_id,
-                StepTemplate.id == child_step.template.id,
-            )
-            .options(
-                chain_load(
-                    StepTemplate.bindings, StepTemplateResourceSlotBinding.resource_slot
+        steps = []
+        for child_step in child_steps:
+            parent_step = steps_by_id.get(child_step.parent_id)
+            if parent_step is None:
+                raise ValueError(
+                    f"Parent step with id {child_step.parent_id} not found in run {pr_model.name}"
+                )
+            template = templates.get(child_step.template.id)
+            if template is None:
+                raise LookupError(
+                    f"StepTemplate: {child_step.template.id} not found in process "
+                    f"template {pr_model.process_template_id}"
                 )
-            ),
-            label="StepTemplate",
-        )
 
-        step_name = child_step.name if child_step.name else template.name
-        if pr_model.steps:
-            idx = 1
-            while step_name in pr_model.steps:
-                idx += 1
-                step_name = f"{step_name} ({idx})"
-
-        with self.session.no_autoflush:
-            step = Step(template=template, name=step_name)
-            # Add before setting parent/backrefs to avoid transient-child warnings.
-            self.session.add(step)
-            step.parent = parent_step
-            pr_model.steps[step.name] = step
-
-        if child_step.parameters:
-            for group_name, params in child_step.parameters.items():
-                if group_name not in step.parameters:
-                    raise ValueError(
-                        f"Step {step_name} has no parameter group {group_name}"
-                    )
-                param = step.parameters[group_name]
-                for key, value in params.items():
-                    if key not in param._values:
+            step_name = child_step.name if child_step.name else template.name
+            if pr_model.steps:
+                idx = 1
+                while step_name in pr_model.steps:
+                    idx += 1
+                    step_name = f"{step_name} ({idx})"
+
+            with self.session.no_autoflush:
+                step = Step(template=template, name=step_name)
+                # Add before setting parent/backrefs to avoid transient-child warnings.
+                self.session.add(step)
+                step.parent = parent_step
+                pr_model.steps[step.name] = step
+
+            if child_step.parameters:
+                for group_name, params in child_step.parameters.items():
+                    if group_name not in step.parameters:
                         raise ValueError(
-                            f"Parameter {key} not found in group {group_name}"
+                            f"Step {step_name} has no parameter group {group_name}"
                         )
-                    av = param._values[key]
-                    if isinstance(value, dict):
-                        av.set_value(value.get("value"))
-                        unit = value.get("unit")
-                    else:
-                        av.set_value(getattr(value, "value", value))
-                        unit = getattr(value, "unit", None)
-                    av.unit = av.template.unit if unit is None else unit
+                    param = step.parameters[group_name]
+                    for key, value in params.items():
+                        if key not in param._values:
+                            raise ValueError(
+                                f"Parameter {key} not found in group {group_name}"
+                            )
+                        av = param._values[key]
+                        if isinstance(value, dict):
+                            av.set_value(value.get("value"))
+                            unit = value.get("unit")
+                        else:
+                            av.set_value(getattr(value, "value", value))
+                            unit = getattr(value, "unit", None)
+                        av.unit = av.template.unit if unit is None else unit
 
-        if child_step.resources:
-            self._assign_step_resources(step, pr_model, child_step.resources)
+            if child_step.resources:
+                self._assign_step_resources(step, pr_model, child_step.resources)
+            steps.append(step)
 
         self.session.flush()
-        return StepSchema.model_validate(step)
+        return [StepSchema.model_validate(step) for step in steps]
 
     def _resource_is_descendant_or_same(self, candidate: Resource, root: Resource):
         current = candidate
@@ -1173,6 +1358,9 @@ class LocalBackend(Backend):
             select(Resource)
             .join(subtree_cte, Resource.id == subtree_cte.c.id)
             .options(*self._resource_subtree_loaders())
+            # Same ordering as the ``Resource.children`` relationship, so
+            # children_map lists (and the hydrated dicts) are name-ordered.
+            .order_by(Resource.name)
         )
         return list(session.scalars(stmt).unique())
 
@@ -1387,14 +1575,32 @@ class LocalBackend(Backend):
         with self._session_scope() as session:
             owns_tx = not session.in_transaction()
             tx = session.begin() if owns_tx else None
-            for step_schema in process_run.steps.values():
-                step: Step = load_single(
-                    session,
+            # One query for every step of the run rather than one per step.
+            # Parameter collections are keyed by their group template's name,
+            # so load those templates up front (and keep a reference, the
+            # identity map is weak); otherwise populating each step's
+            # parameters lazy-loads its templates one by one.
+            step_ids = [s.id for s in process_run.steps.values()]
+            _group_templates = session.scalars(
+                select(AttributeGroupTemplate)
+                .join(
+                    Parameter,
+                    Parameter.attribute_group_template_id == AttributeGroupTemplate.id,
+                )
+                .where(Parameter.step_id.in_(step_ids))
+            ).all()
+            steps_by_id = {
+                step.id: step
+                for step in session.scalars(
                     select(Step)
-                    .where(Step.id == step_schema.id)
-                    .options(chain_load(Step.parameters, Parameter._values)),
-                    label="Step",
+                    .where(Step.id.in_(step_ids))
+                    .options(chain_load(Step.parameters, Parameter._values))
                 )
+            }
+            for step_schema in process_run.steps.values():
+                step = steps_by_id.get(step_schema.id)
+                if step is None:
+                    raise LookupError(f"Step: no step with id {step_schema.id}")
                 for _, param_schema in step_schema.parameters.items():
                     group_name = param_schema.template.name
                     if group_name not in step.parameters:
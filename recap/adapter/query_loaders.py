@@ -148,6 +148,34 @@ EXTRA_FULL_LOADERS = {
 }
 
 
+# Relationships walked by Resource.__init__ / Step.__init__ / ProcessRun.__init__
+# while instantiating rows from a template. Apply these to the statement that
+# loads the template so construction does not lazy-load once per node.
+RESOURCE_TEMPLATE_INIT_LOADERS = [
+    chain_load(ResourceTemplate.children),
+    chain_load(ResourceTemplate.types),
+    chain_load(
+        ResourceTemplate.attribute_group_templates,
+        AttributeGroupTemplate.attribute_templates,
+    ),
+]
+
+STEP_TEMPLATE_INIT_LOADERS = [
+    chain_load(
+        StepTemplate.attribute_group_templates,
+        AttributeGroupTemplate.attribute_templates,
+    ),
+]
+
+PROCESS_TEMPLATE_INIT_LOADERS = [
+    chain_load(
+        ProcessTemplate.step_templates,
+        StepTemplate.attribute_group_templates,
+        AttributeGroupTemplate.attribute_templates,
+    ),
+]
+
+
 def preload_options(schema: type[BaseModel], name: str) -> list:
     return PRELOAD_STATEMENTS[(schema, name)]
 
@@ -13,7 +13,7 @@ from recap.adapter.local import LocalBackend
 from recap.dsl.process_builder import ProcessRunBuilder, ProcessTemplateBuilder
 from recap.dsl.query import QueryDSL
 from recap.dsl.resource_builder import ResourceBuilder, ResourceTemplateBuilder
-from recap.schemas.process import CampaignSchema
+from recap.schemas.process import CampaignSchema, warmup_schemas
 from recap.schemas.resource import ResourceRef, ResourceSchema
 from recap.utils.migrations import apply_migrations
 
@@ -77,6 +77,7 @@ class RecapClient:
                     bind=self.engine, expire_on_commit=False, future=True
                 )
                 self.backend = LocalBackend(self._sessionmaker)
+                warmup_schemas()
             else:
                 raise ValueError(f"Unknown scheme: {parsed.scheme}")
 
@@ -28,6 +28,7 @@ class AttributeGroupTemplate(TimestampMixin, Base):
     slug: Mapped[str | None] = mapped_column(nullable=True)
     attribute_templates: Mapped[list["AttributeTemplate"]] = relationship(
         back_populates="attribute_group_template",
+        lazy="selectin",
     )
 
     resource_template_id: Mapped[UUID | None] = mapped_column(
@@ -108,6 +109,19 @@ def _before_update(mapper, connection, target: AttributeTemplate):
     target.slug = make_slug(target.name)
 
 
+def value_to_json(template: AttributeTemplate, value):
+    """Validate ``value`` against ``template`` and return its JSON form."""
+    vt = template.value_type
+    if vt == "enum":
+        choices = (template.metadata_json or {}).get("choices")
+        if not choices:
+            raise ValueError("enum attributes require metadata.choices to be set")
+        if str(value) not in choices:
+            raise ValueError(f"{template.name} must be one of {', '.join(choices)}")
+        value = str(value)
+    return to_json_compatible(vt, value)
+
+
 class AttributeValue(TimestampMixin, Base):
     __tablename__ = "attribute_value"
     id: Mapped[UUID] = mapped_column(primary_key=True, default=uuid4)
@@ -118,17 +132,25 @@ class AttributeValue(TimestampMixin, Base):
     template = relationship(AttributeTemplate)
 
     parameter_id: Mapped[UUID] = mapped_column(
-        ForeignKey("parameter.id"), nullable=True
+        ForeignKey("parameter.id"), nullable=True, index=True
     )
     parameter = relationship("Parameter", back_populates="_values")
 
-    property_id: Mapped[UUID] = mapped_column(ForeignKey("property.id"), nullable=True)
+    property_id: Mapped[UUID] = mapped_column(
+        ForeignKey("property.id"), nullable=True, index=True
+    )
     property = relationship("Property", back_populates="_values")
 
     unit: Mapped[str | None] = mapped_column(nullable=True)
     value_json: Mapped[Any | None] = mapped_column("value", JSON, nullable=True)
+    # Per-value metadata is not part of AttributeValueSchema; keep it out of
+    # the row fetch for property/parameter loads until it is accessed.
     metadata_json: Mapped[dict[str, Any] | None] = mapped_column(
-        "metadata", MutableDict.as_mutable(JSON), nullable=True, default=dict
+        "metadata",
+        MutableDict.as_mutable(JSON),
+        nullable=True,
+        default=dict,
+        deferred=True,
     )
 
     def __init__(self, *args, **kwargs):
@@ -145,24 +167,18 @@ class AttributeValue(TimestampMixin, Base):
         self.unit = raw_unit
         if raw_value is None and self.template:
             raw_value = self.template.default_value
-        if raw_value is not None:
+        # Enum values must name a choice, so an enum without a default fails
+        # here rather than when the value is first read back
+        if raw_value is not None or (
+            self.template is not None and self.template.value_type == "enum"
+        ):
             self.set_value(raw_value)
 
     def set_value(self, value):
         if not self.parameter and not self.property:
             raise ValueError("Parameter or Property must be set before assigning value")
 
-        vt = self.template.value_type
-        if vt == "enum":
-            choices = (self.template.metadata_json or {}).get("choices")
-            if not choices:
-                raise ValueError("enum attributes require metadata.choices to be set")
-            if str(value) not in choices:
-                raise ValueError(
-                    f"{self.template.name} must be one of {', '.join(choices)}"
-                )
-            value = str(value)
-        self.value_json = to_json_compatible(vt, value)
+        self.value_json = value_to_json(self.template, value)
 
     @hybrid_property
     def value(self):
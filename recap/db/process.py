@@ -224,7 +224,9 @@ class ResourceAssignment(TimestampMixin, Base):
         ForeignKey("resource_slot.id"), nullable=False
     )
     step_id: Mapped[UUID | None] = mapped_column(ForeignKey("step.id"), nullable=True)
-    resource_id: Mapped[UUID] = mapped_column(ForeignKey("resource.id"), nullable=False)
+    resource_id: Mapped[UUID] = mapped_column(
+        ForeignKey("resource.id"), nullable=False, index=True
+    )
 
     process_run: Mapped["ProcessRun"] = relationship("ProcessRun")
     resource_slot: Mapped["ResourceSlot"] = relationship()
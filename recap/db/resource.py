@@ -1,3 +1,5 @@
+from collections import deque
+from operator import attrgetter
 from typing import TYPE_CHECKING
 from uuid import UUID, uuid4
 
@@ -37,7 +39,9 @@ class Property(TimestampMixin, Base):
     __tablename__ = "property"
     id: Mapped[UUID] = mapped_column(primary_key=True, default=uuid4)
 
-    resource_id: Mapped[UUID] = mapped_column(ForeignKey("resource.id"), nullable=False)
+    resource_id: Mapped[UUID] = mapped_column(
+        ForeignKey("resource.id"), nullable=False, index=True
+    )
     resource: Mapped["Resource"] = relationship(back_populates="properties")
 
     attribute_group_template_id: Mapped[UUID] = mapped_column(
@@ -63,9 +67,9 @@ class Property(TimestampMixin, Base):
 
         template: AttributeGroupTemplate = kwargs.get("template")
         super().__init__(*args, **kwargs)
+        # AttributeValue.__init__ applies the template default and unit
         for vt in template.attribute_templates:
-            av = AttributeValue(template=vt, property=self)
-            av.set_value(vt.default_value)
+            AttributeValue(template=vt, property=self)
 
 
 resource_template_type_association = Table(
@@ -90,7 +94,7 @@ class ResourceTemplate(TimestampMixin, Base):
         secondary=resource_template_type_association,
     )
     parent_id: Mapped[UUID | None] = mapped_column(
-        ForeignKey("resource_template.id"), nullable=True
+        ForeignKey("resource_template.id"), nullable=True, index=True
     )
     parent: Mapped["ResourceTemplate"] = relationship(
         "ResourceTemplate", back_populates="children", remote_side=[id]
@@ -106,6 +110,7 @@ class ResourceTemplate(TimestampMixin, Base):
         "AttributeGroupTemplate",
         back_populates="resource_template",
         cascade="all, delete-orphan",
+        lazy="selectin",
     )
 
     __table_args__ = (
@@ -159,19 +164,23 @@ class Resource(TimestampMixin, Base):
     slug: Mapped[str | None] = mapped_column(nullable=True, index=True)
     active: Mapped[bool] = mapped_column(nullable=False, default=True)
     resource_template_id: Mapped[UUID] = mapped_column(
-        ForeignKey("resource_template.id"), nullable=True
+        ForeignKey("resource_template.id"), nullable=True, index=True
     )
     template: Mapped["ResourceTemplate"] = relationship()
     parent_id: Mapped[UUID | None] = mapped_column(
-        ForeignKey("resource.id"), nullable=True
+        ForeignKey("resource.id"), nullable=True, index=True
     )
     parent: Mapped["Resource"] = relationship(
         "Resource", back_populates="children", remote_side=[id]
     )
+    # Ordered by name so expanded children come back in well order
+    # (A01, A02, ...) without callers re-sorting; served by the
+    # uq_resource_parent_name index.
     children: Mapped[dict[str, "Resource"]] = relationship(
         "Resource",
         back_populates="parent",
         collection_class=mapped_collection(lambda c: c.name),
+        order_by="Resource.name",
     )
     properties = relationship(
         "Property",
@@ -179,6 +188,9 @@ class Resource(TimestampMixin, Base):
         back_populates="resource",
         cascade="all, delete-orphan",
     )
+    # The cascade stays on the ORM side: SQLite connections are not opened with
+    # PRAGMA foreign_keys=ON, so an ON DELETE CASCADE + passive_deletes setup
+    # would leave orphaned assignments behind.
     assignments: Mapped[list["ResourceAssignment"]] = relationship(
         "ResourceAssignment", back_populates="resource", cascade="all, delete-orphan"
     )
@@ -208,37 +220,44 @@ class Resource(TimestampMixin, Base):
     ):
         """
         Automatically initialize resource from resource_template
+        - Walks the template tree breadth-first with an explicit queue
         - Use visited to avoid using the same resource_template to prevent cycles
-        - max_depth should prevent too many recursions
+        - max_depth should prevent too many levels of children
         - Only add properties if not present
         """
         if not resource_template:
             return
 
-        if max_depth <= 0:
-            return
-
         if visited is None:
             visited = set()
 
-        if resource_template.id in visited:
-            return
-
-        visited.add(resource_template.id)
-        for prop in self.template.attribute_group_templates:
-            if not any(p.template.id == prop.id for name, p in self.properties.items()):
-                self.properties[prop.name] = Property(template=prop)
-
-        for child_ct in self.template.children.values():
-            if child_ct.id is not None and child_ct.id in visited:
+        queue = deque([(self, resource_template, max_depth)])
+        while queue:
+            node, tmpl, depth = queue.popleft()
+            if depth <= 0 or tmpl.id in visited:
                 continue
-            Resource(
-                name=child_ct.name,
-                template=child_ct,
-                parent=self,
-                _visited_children=visited,
-                _max_depth=max_depth - 1,
-            )
+            visited.add(tmpl.id)
+
+            existing = {p.template.id for p in node.properties.values()}
+            for prop in tmpl.attribute_group_templates:
+                if prop.id not in existing:
+                    node.properties[prop.name] = Property(template=prop)
+                    existing.add(prop.id)
+
+            # Name order, matching how Resource.children is loaded back
+            for child_ct in sorted(tmpl.children.values(), key=attrgetter("name")):
+                if child_ct.id is not None and child_ct.id in visited:
+                    continue
+                # A new resource has no rows below it yet; start its children
+                # collection empty so reading it after flush does not lazy-load
+                child = Resource(
+                    name=child_ct.name,
+                    template=child_ct,
+                    parent=node,
+                    children={},
+                    _init_children=False,
+                )
+                queue.append((child, child_ct, depth - 1))
 
     __table_args__ = (
         UniqueConstraint(
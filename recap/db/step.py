@@ -31,7 +31,9 @@ class Parameter(TimestampMixin, Base):  # , AttributeValueMixin):
     __tablename__ = "parameter"
     id: Mapped[UUID] = mapped_column(primary_key=True, default=uuid4)
 
-    step_id: Mapped[UUID] = mapped_column(ForeignKey("step.id"), nullable=False)
+    step_id: Mapped[UUID] = mapped_column(
+        ForeignKey("step.id"), nullable=False, index=True
+    )
     step: Mapped["Step"] = relationship(back_populates="parameters")
 
     attribute_group_template_id: Mapped[UUID] = mapped_column(
@@ -54,9 +56,9 @@ class Parameter(TimestampMixin, Base):  # , AttributeValueMixin):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        # AttributeValue.__init__ applies the template default and unit
         for value_template in self.template.attribute_templates:
-            av = AttributeValue(template=value_template, parameter=self)
-            av.set_value(value_template.default_value)
+            AttributeValue(template=value_template, parameter=self)
 
 
 class StepTemplate(TimestampMixin, Base):
@@ -67,6 +69,7 @@ class StepTemplate(TimestampMixin, Base):
         "AttributeGroupTemplate",
         back_populates="step_template",
         cascade="all, delete-orphan",
+        lazy="selectin",
     )
     process_template_id: Mapped[UUID] = mapped_column(
         ForeignKey("process_template.id"),
@@ -212,26 +215,24 @@ class Step(TimestampMixin, Base):
     )
 
     def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
         template: StepTemplate | None = kwargs.get("template")
-        if not template:
-            return
         # If no name specified use the templates name
-        if self.name is None:
-            self.name = template.name
-
-        self._initialize_from_step_type(template)
+        if template is not None and kwargs.get("name") is None:
+            kwargs["name"] = template.name
+        super().__init__(*args, **kwargs)
+        if template is not None:
+            self._initialize_from_step_type(template)
 
     def _initialize_from_step_type(self, template: StepTemplate):
         """
         Automatically initialize step from step_type
         - Only add parameters if not present
         """
+        existing = {p.template.id for p in self.parameters.values()}
         for param in self.template.attribute_group_templates:
-            if not any(
-                p.template.id == param.id for name, p in self.parameters.items()
-            ):
+            if param.id not in existing:
                 self.parameters[param.name] = Parameter(template=param)
+                existing.add(param.id)
 
     def is_root(self) -> bool:
         return not self.prev_steps
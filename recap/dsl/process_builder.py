@@ -498,6 +498,31 @@ class ProcessRunBuilder:
         child_step: StepSchema,
     ) -> StepSchema:
         self._ensure_uow()
+        self._check_child_step(child_step)
+        child = self.backend.add_child_step(self.process_run, child_step)
+        # refresh cached steps so subsequent operations see the new child
+        self._steps = None
+        return child
+
+    def add_child_steps_bulk(
+        self,
+        child_steps: list[StepSchema],
+    ) -> list[StepSchema]:
+        """
+        Add many child steps at once. Equivalent to calling add_child_step for
+        each entry, but the run and step templates are resolved once and the
+        backend flushes a single time for the whole batch.
+        """
+        self._ensure_uow()
+        for child_step in child_steps:
+            self._check_child_step(child_step)
+        if not child_steps:
+            return []
+        children = self.backend.add_child_steps(self.process_run, child_steps)
+        self._steps = None
+        return children
+
+    def _check_child_step(self, child_step: StepSchema):
         if child_step.parent_id is None:
             raise ValueError(
                 f"Child step {child_step.name} has no parent_id, was the step created using generate_child()?"
@@ -506,10 +531,6 @@ class ProcessRunBuilder:
             raise ValueError(
                 f"Child step {child_step.name} does not belong to {self._process_run.name}"
             )
-        child = self.backend.add_child_step(self.process_run, child_step)
-        # refresh cached steps so subsequent operations see the new child
-        self._steps = None
-        return child
 
     def get_model(self, *, update: bool = False) -> ProcessRunSchema:
         """
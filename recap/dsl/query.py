@@ -393,6 +393,9 @@ class ResourceQuery(BaseQuery[ResourceSchema | ResourceRef]):
     def include_template(self) -> "ResourceQuery":
         return self.include("template")
 
+    def include_properties(self) -> "ResourceQuery":
+        return self.include("properties")
+
     def filter_property(
         self,
         name: str,
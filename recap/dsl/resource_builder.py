@@ -497,6 +497,94 @@ class ResourceTemplateBuilder:
         )
         return child_builder
 
+    def add_children_bulk(
+        self, rows: list[dict[str, Any]], version: str = "1.0"
+    ) -> "ResourceTemplateBuilder":
+        """Add many child templates to this resource template in one batch.
+
+        Equivalent to calling ``add_child(...).add_properties(...).close_child()``
+        once per row, but every child, property group and attribute is
+        written with a single bulk INSERT per table.
+
+        Args:
+            rows: One dict per child with the keys ``name``, ``type_names``,
+                ``properties`` (optional, same shape as :meth:`add_properties`)
+                and ``version`` (optional).
+            version: Version used for rows that do not set their own.
+
+        Example::
+
+            template_builder.add_children_bulk([
+                {
+                    "name": f"A{col:02d}",
+                    "type_names": ["container", "well"],
+                    "properties": {
+                        "content": [{"name": "volume", "type": "float", "default": 0}]
+                    },
+                }
+                for col in range(1, 13)
+            ])
+
+        Rows that share the same ``properties`` dict are validated and
+        expanded once, so build it outside the comprehension when every child
+        has the same property groups.
+
+        Children that already exist with the same name and version are reused
+        unchanged, following this builder's ``on_existing`` policy.
+
+        Returns:
+            ``self``, to allow method chaining.
+        """
+        self._ensure_uow()
+        type_names = list(dict.fromkeys(n for row in rows for n in row["type_names"]))
+        resource_types = {
+            rt.name: rt for rt in self.backend.add_resource_types(type_names)
+        }
+        # Validate each distinct properties mapping once; rows that share one
+        # also share the validated result, which the backend reuses per child
+        validated: dict[int, tuple[dict, dict[str, list]]] = {}
+
+        def _validate(prop_def: dict[str, list[dict[str, Any]]]):
+            if id(prop_def) not in validated:
+                validated[id(prop_def)] = (
+                    prop_def,
+                    {
+                        group_key: [
+                            AttributeTemplateValidator.model_validate(prop)
+                            for prop in props
+                        ]
+                        for group_key, props in prop_def.items()
+                    },
+                )
+            return validated[id(prop_def)][1]
+
+        children = [
+            {
+                "name": row["name"],
+                "version": row.get("version", version),
+                "types": [resource_types[n] for n in row["type_names"]],
+                "properties": _validate(row.get("properties", {})),
+            }
+            for row in rows
+        ]
+        existing = self.backend.add_child_resource_templates(children, self.template)
+        if existing:
+            if self.on_existing == "raise":
+                raise ExistingResourceTemplateError(
+                    f"Resource templates {existing!r} already exist under {self.name!r}"
+                )
+            if self.on_existing == "warn":
+                warnings.warn(
+                    (
+                        f"Resource templates {existing!r} already exist under "
+                        f"{self.name!r} and will be reused; no new templates "
+                        "will be created for them."
+                    ),
+                    ExistingResourceTemplateWarning,
+                    stacklevel=2,
+                )
+        return self
+
     def _reload_template(self):
         self._ensure_uow()
         self._template = self.backend.get_resource_template(
@@ -20,6 +20,7 @@ from pydantic import (
     BaseModel,
     ConfigDict,
     Field,
+    PrivateAttr,
     ValidationInfo,
     field_validator,
     model_validator,
@@ -30,6 +31,63 @@ from recap.utils.general import CONVERTERS
 
 TypeName = Literal["int", "float", "bool", "str", "datetime", "array", "enum"]
 
+# Converters resolved once per TypeName, and the exact Python type a value must
+# already have for coercion to be skipped.
+_CONVERTERS_BY_TYPE = {t: CONVERTERS[t] for t in TypeName.__args__}
+_PASSTHROUGH_TYPES = {"int": int, "float": float, "bool": bool, "str": str}
+
+
+def attribute_metadata(vt: Any) -> dict:
+    """Extract the metadata dict from an attribute template ORM object or schema.
+
+    Handles the two common shapes: a ``metadata`` attribute (dict) on Pydantic
+    models and a ``metadata_json`` attribute (dict) on SQLAlchemy ORM objects.
+    Returns an empty dict when neither is present.
+    """
+    meta = getattr(vt, "metadata", None)
+    if isinstance(meta, dict):
+        return meta
+    meta_json = getattr(vt, "metadata_json", None)
+    if isinstance(meta_json, dict):
+        return meta_json
+    return {}
+
+
+def _check_enum_choices(value: Any, metadata: dict[str, Any] | None) -> None:
+    choices = (metadata or {}).get("choices")
+    if not choices:
+        raise ValueError("enum attributes require metadata.choices to be set")
+    if value is not None and str(value) not in choices:
+        raise ValueError(f"default must be one of {', '.join(choices)} (got {value})")
+
+
+def coerce_value(t: str, v: Any, metadata: dict[str, Any] | None = None) -> Any:
+    """Coerce *v* to the Python type declared by *t*.
+
+    This is the conversion :class:`AttributeTemplateValidator` applies to its
+    ``default``, exposed as a plain function so hot paths can coerce values
+    without building a validator model per value.  When *metadata* is given,
+    ``enum`` values are also checked against ``metadata.choices``.
+
+    Raises:
+        ValueError: If *t* is unsupported, *v* cannot be coerced, or an
+            ``enum`` value is not one of the declared choices.
+    """
+    if type(v) is _PASSTHROUGH_TYPES.get(t):
+        return v
+    conv = _CONVERTERS_BY_TYPE.get(t)
+    if conv is None:
+        raise ValueError(f"Unsupported type: {t!r}")
+    try:
+        coerced = conv(v)
+    except Exception as e:
+        raise ValueError(f"`default` not coercible to {t}: {e}") from e
+    if t == "enum":
+        coerced = str(coerced)
+        if metadata is not None:
+            _check_enum_choices(coerced, metadata)
+    return coerced
+
 
 class AttributeTemplateSchema(CommonFields):
     """Persisted blueprint for a single typed attribute.
@@ -100,6 +158,19 @@ class AttributeGroupTemplateSchema(CommonFields):
     slug: Annotated[str, SIMPLE_FIELD]
     attribute_templates: list[AttributeTemplateSchema]
 
+    _by_name: dict[str, AttributeTemplateSchema] | None = PrivateAttr(default=None)
+
+    def by_name(self) -> dict[str, AttributeTemplateSchema]:
+        """Return ``{attribute name: template}``, built once per instance.
+
+        The mapping is cached on first use; templates are treated as
+        immutable once loaded, so the cache is not invalidated if
+        ``attribute_templates`` is mutated in place.
+        """
+        if self._by_name is None:
+            self._by_name = {a.name: a for a in self.attribute_templates}
+        return self._by_name
+
 
 class AttributeValueSchema(BaseModel):
     """A single stored attribute value with an optional physical unit.
@@ -189,16 +260,7 @@ class AttributeTemplateValidator(BaseModel):
         t = info.data.get("type")
         if t is None:
             raise ValueError("`type` must be provided before `default`")
-        conv = CONVERTERS.get(t)
-        if conv is None:
-            raise ValueError(f"Unsupported type: {t!r}")
-        try:
-            coerced = conv(v)
-        except Exception as e:
-            raise ValueError(f"`default` not coercible to {t}: {e}") from e
-        if t == "enum":
-            coerced = str(coerced)
-        return coerced
+        return coerce_value(t, v)
 
     @model_validator(mode="after")
     def enforce_enum_choices(self) -> "AttributeTemplateValidator":
@@ -208,14 +270,6 @@ class AttributeTemplateValidator(BaseModel):
             ValueError: If ``type`` is ``"enum"`` and ``metadata.choices`` is
                 absent, empty, or does not contain the declared *default*.
         """
-        if self.type != "enum":
-            return self
-
-        choices = (self.metadata or {}).get("choices")
-        if not choices:
-            raise ValueError("enum attributes require metadata.choices to be set")
-        if self.default is not None and str(self.default) not in choices:
-            raise ValueError(
-                f"default must be one of {', '.join(choices)} (got {self.default})"
-            )
+        if self.type == "enum":
+            _check_enum_choices(self.default, self.metadata)
         return self
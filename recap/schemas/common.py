@@ -76,6 +76,19 @@ TYPE_MAP = {
     ValueType.ENUM: str,
 }
 
+# Exact-type checks for default values. ``bool`` is a subclass of ``int`` so
+# isinstance() would let ``True`` through as an INT default; compare types
+# directly instead. FLOAT also accepts ints, which pydantic keeps as int.
+_TYPE_CHECKS = {
+    ValueType.INT: lambda v: type(v) is int,
+    ValueType.FLOAT: lambda v: type(v) is float or type(v) is int,
+    ValueType.BOOL: lambda v: type(v) is bool,
+    ValueType.STR: lambda v: type(v) is str,
+    ValueType.ENUM: lambda v: type(v) is str,
+    ValueType.DATETIME: lambda v: isinstance(v, datetime),
+    ValueType.ARRAY: lambda v: isinstance(v, list),
+}
+
 # DefaultValue = Union[int, float, bool, str]
 DefaultValue = int | float | bool | str | datetime | list | None
 
@@ -106,10 +119,11 @@ class Attribute(BaseModel):
         """Validate that *default_value* matches the declared *value_type*.
 
         Raises:
-            ValueError: If ``default_value`` is not an instance of the Python
-                type mapped to ``value_type`` in :data:`TYPE_MAP`.
+            ValueError: If ``default_value`` is not of the Python type mapped
+                to ``value_type`` in :data:`TYPE_MAP` (``bool`` is not accepted
+                for ``INT``; ``int`` is accepted for ``FLOAT``).
         """
-        if not isinstance(self.default_value, TYPE_MAP[self.value_type]):
+        if not _TYPE_CHECKS[self.value_type](self.default_value):
             raise ValueError(
                 f"default_value must be {TYPE_MAP[self.value_type].__name__}",
                 f"got {type(self.default_value).__name__} instead.",
@@ -133,4 +147,8 @@ class CommonFields(BaseModel):
     create_date: Annotated[datetime, SIMPLE_FIELD] = Field(repr=False)
     modified_date: Annotated[datetime, SIMPLE_FIELD] = Field(repr=False)
 
-    model_config = ConfigDict(from_attributes=True, populate_by_name=True)
+    # Validators are compiled on first use (or by warmup_schemas()) rather
+    # than at import time; subclasses inherit this.
+    model_config = ConfigDict(
+        from_attributes=True, populate_by_name=True, defer_build=True
+    )
@@ -21,7 +21,12 @@ from pydantic import ConfigDict, PrivateAttr, field_validator
 
 from recap.exceptions import UnloadedFieldError, UnloadedFieldWarning
 from recap.schemas.common import SIMPLE_FIELD, CommonFields
-from recap.schemas.resource import ResourceAssignmentSchema, ResourceSlotSchema
+from recap.schemas.resource import (
+    ResourceAssignmentSchema,
+    ResourceSchema,
+    ResourceSlotSchema,
+    ResourceTemplateSchema,
+)
 from recap.schemas.step import StepSchema, StepTemplateSchema
 
 
@@ -40,6 +45,8 @@ class ProcessTemplateRef(CommonFields):
     name: Annotated[str, SIMPLE_FIELD]
     version: Annotated[str, SIMPLE_FIELD]
 
+    model_config = ConfigDict(frozen=True)
+
 
 class ProcessTemplateSchema(CommonFields):
     """Blueprint for a workflow, defining its ordered steps and resource slots.
@@ -203,3 +210,23 @@ class CampaignSchema(CommonFields):
     saf: Annotated[str | None, SIMPLE_FIELD]
     meta_data: Annotated[dict[str, Any] | None, SIMPLE_FIELD]
     process_runs: list["ProcessRunSchema"]
+
+
+def warmup_schemas() -> None:
+    """Build the core schemas of the deferred response models.
+
+    Every :class:`~recap.schemas.common.CommonFields` subclass is declared
+    with ``defer_build=True`` so that importing :mod:`recap` does not pay
+    for compiling validators it may never use.  Call this once at startup
+    to move that cost for the models the backends return out of the first
+    query.
+    """
+    for schema in (
+        CampaignSchema,
+        ProcessTemplateSchema,
+        ProcessRunSchema,
+        StepSchema,
+        ResourceTemplateSchema,
+        ResourceSchema,
+    ):
+        schema.model_rebuild()
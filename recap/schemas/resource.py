@@ -22,37 +22,29 @@ except ImportError:  # Python <3.11
 
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, model_validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    PrivateAttr,
+    ValidationInfo,
+    field_validator,
+    model_validator,
+)
 
 from recap.db.resource import Property
 from recap.exceptions import UnloadedFieldError, UnloadedFieldWarning
 from recap.schemas.attribute import (
     AttributeGroupTemplateSchema,
-    AttributeTemplateValidator,
     AttributeValueSchema,
+    attribute_metadata,
+    coerce_value,
 )
 from recap.schemas.common import SIMPLE_FIELD, CommonFields
 from recap.utils.dsl import build_param_values_model, build_property_groups_model
 from recap.utils.general import Direction
 
 
-def _attr_metadata(vt: Any) -> dict | None:
-    """Extract the metadata dict from an attribute template ORM object or schema.
-
-    Handles the two common shapes: a ``metadata`` attribute (dict) returned by
-    Pydantic models and a ``metadata_json`` attribute (dict) returned by
-    SQLAlchemy ORM objects.  Returns an empty dict when neither is present.
-    """
-    meta = getattr(vt, "metadata", None)
-    meta_json = getattr(vt, "metadata_json", None)
-    if isinstance(meta, dict):
-        return meta
-    elif isinstance(meta_json, dict):
-        return meta_json
-    else:
-        return {}
-
-
 class PropertySchema(CommonFields):
     """A property group instance attached to a resource.
 
@@ -96,7 +88,7 @@ class PropertySchema(CommonFields):
                     vt.name,
                     vt.slug,
                     vt.value_type,
-                    _attr_metadata(vt),
+                    attribute_metadata(vt),
                     vt.unit,
                 )
                 for vt in tmpl.attribute_templates
@@ -117,14 +109,14 @@ class PropertySchema(CommonFields):
             tmpl = data.get("template")
             if tmpl:
                 tmpl_names = {a.name for a in tmpl.attribute_templates}
-                unknown = set(data["values"]) - tmpl_names
+                unknown = data["values"].keys() - tmpl_names
                 if unknown:
                     raise ValueError(
                         f"Unknown property(s) for template {tmpl.name}: "
                         f"{', '.join(sorted(unknown))}"
                     )
                 tmpl_key = tuple(
-                    (vt.name, vt.slug, vt.value_type, _attr_metadata(vt), vt.unit)
+                    (vt.name, vt.slug, vt.value_type, attribute_metadata(vt), vt.unit)
                     for vt in tmpl.attribute_templates
                 )
                 values_model = build_param_values_model(
@@ -139,11 +131,11 @@ class PropertySchema(CommonFields):
 
         Iterates over every attribute in ``template.attribute_templates``,
         runs the value through
-        :class:`~recap.schemas.attribute.AttributeTemplateValidator`, and
+        :func:`~recap.schemas.attribute.coerce_value`, and
         rebuilds ``values`` with the coerced results.  Raises
         :class:`ValueError` if any unknown keys are present.
         """
-        tmpl_by_name = {a.name: a for a in self.template.attribute_templates}
+        tmpl_by_name = self.template.by_name()
 
         values_dict = (
             self.values.model_dump(by_alias=True)
@@ -151,7 +143,9 @@ class PropertySchema(CommonFields):
             else dict(self.values)
         )
 
-        unknown_keys = set(values_dict) - set(tmpl_by_name)
+        # Reject unknown keys before coercing anything, so that error is
+        # reported ahead of any coercion failure.
+        unknown_keys = values_dict.keys() - tmpl_by_name.keys()
         if unknown_keys:
             raise ValueError(
                 f"Unknown property(s) for template {self.template.name}: "
@@ -167,15 +161,15 @@ class PropertySchema(CommonFields):
             else:
                 raw_unit = None
 
-            validator = AttributeTemplateValidator(
-                name=attr_tmpl.name,
-                type=attr_tmpl.value_type,
-                unit=attr_tmpl.unit,
-                metadata=_attr_metadata(attr_tmpl),
-                default=raw_value,
+            value_type = attr_tmpl.value_type
+            # Only enum coercion consults the template metadata.
+            value = coerce_value(
+                value_type,
+                raw_value,
+                attribute_metadata(attr_tmpl) if value_type == "enum" else None,
             )
             coerced[name] = {
-                "value": validator.default,
+                "value": value,
                 "unit": attr_tmpl.unit if raw_unit is None else raw_unit,
             }
 
@@ -284,6 +278,8 @@ class ResourceTypeSchema(CommonFields):
 
     name: Annotated[str, SIMPLE_FIELD]
 
+    model_config = ConfigDict(frozen=True)
+
 
 class ResourceTemplateRef(CommonFields):
     """Lightweight reference to a resource template, without child or property detail.
@@ -337,9 +333,6 @@ class ResourceTemplateSchema(CommonFields):
     attribute_group_templates: list[AttributeGroupTemplateSchema]
 
 
-ResourceTypeSchema.model_rebuild()
-
-
 class ResourceSlotSchema(CommonFields):
     """A typed slot on a process template that accepts a specific resource type.
 
@@ -360,6 +353,8 @@ class ResourceSlotSchema(CommonFields):
     direction: Annotated[Direction, SIMPLE_FIELD]
     required: Annotated[bool, SIMPLE_FIELD] = True
 
+    model_config = ConfigDict(frozen=True)
+
 
 class ResourceSchema(CommonFields):
     """A concrete resource instance created from a :class:`ResourceTemplateSchema`.
@@ -434,6 +429,27 @@ class ResourceSchema(CommonFields):
             self._handle_unloaded("children", "include('children')")
         return super().__getattribute__(name)
 
+    @field_validator("children", mode="wrap")
+    @classmethod
+    def limit_children_depth(cls, v, handler, info: ValidationInfo):
+        """Stop materialising children below ``context["max_depth"]`` levels.
+
+        ``ResourceSchema.model_validate(obj, context={"max_depth": 2})``
+        validates the resource, its children and grandchildren, and leaves
+        ``children`` empty on the deepest level.  Without a ``max_depth`` in
+        the context the whole tree is validated.
+        """
+        max_depth = info.context.get("max_depth") if info.context else None
+        if max_depth is None:
+            return handler(v)
+        if max_depth <= 0:
+            return {}
+        info.context["max_depth"] = max_depth - 1
+        try:
+            return handler(v)
+        finally:
+            info.context["max_depth"] = max_depth
+
     @model_validator(mode="after")
     def build_property_model(self) -> "ResourceSchema":
         """Convert the raw ``properties`` dict into a dynamic Pydantic model.
@@ -14,16 +14,18 @@ a :class:`~recap.schemas.process.ProcessRunSchema`:
   serialisation.
 """
 
+from functools import lru_cache
 from typing import Annotated, Any
 from uuid import UUID
 
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, model_validator
 
 from recap.db.step import Parameter
 from recap.schemas.attribute import (
     AttributeGroupTemplateSchema,
-    AttributeTemplateValidator,
     AttributeValueSchema,
+    attribute_metadata,
+    coerce_value,
 )
 from recap.schemas.common import SIMPLE_FIELD, CommonFields, StepStatus
 from recap.schemas.resource import ResourceSchema, ResourceSlotSchema
@@ -33,23 +35,6 @@ from recap.utils.dsl import (
 )
 
 
-def _attr_metadata(vt: Any) -> dict | None:
-    """Extract the metadata dict from an attribute template ORM object or schema.
-
-    Handles the two common shapes: a ``metadata`` attribute (dict) on Pydantic
-    models and a ``metadata_json`` attribute (dict) on SQLAlchemy ORM objects.
-    Returns an empty dict when neither is present.
-    """
-    meta = getattr(vt, "metadata", None)
-    meta_json = getattr(vt, "metadata_json", None)
-    if isinstance(meta, dict):
-        return meta
-    elif isinstance(meta_json, dict):
-        return meta_json
-    else:
-        return {}
-
-
 class StepTemplateRef(CommonFields):
     """Lightweight reference to a step template, containing only identity fields.
 
@@ -63,6 +48,8 @@ class StepTemplateRef(CommonFields):
 
     name: Annotated[str, SIMPLE_FIELD]
 
+    model_config = ConfigDict(frozen=True)
+
 
 class StepTemplateSchema(CommonFields):
     """Blueprint for a single workflow step within a process template.
@@ -126,7 +113,7 @@ class ParameterSchema(CommonFields):
                     vt.name,
                     vt.slug,
                     vt.value_type,
-                    _attr_metadata(vt),
+                    attribute_metadata(vt),
                     vt.unit,
                 )
                 for vt in tmpl.attribute_templates
@@ -151,7 +138,7 @@ class ParameterSchema(CommonFields):
                         vt.name,
                         vt.slug,
                         vt.value_type,
-                        _attr_metadata(vt),
+                        attribute_metadata(vt),
                         vt.unit,
                     )
                     for vt in tmpl.attribute_templates
@@ -177,7 +164,7 @@ class ParameterSchema(CommonFields):
         raw_values = data.get("values") or {}
         if template and isinstance(raw_values, dict):
             tmpl_names = {a.name for a in template.attribute_templates}
-            unknown = set(raw_values) - tmpl_names
+            unknown = raw_values.keys() - tmpl_names
             if unknown:
                 raise ValueError(
                     f"Unknown parameter(s) for template {template.name}: "
@@ -188,7 +175,7 @@ class ParameterSchema(CommonFields):
                     vt.name,
                     vt.slug,
                     vt.value_type,
-                    _attr_metadata(vt),
+                    attribute_metadata(vt),
                     vt.unit,
                 )
                 for vt in template.attribute_templates
@@ -205,12 +192,12 @@ class ParameterSchema(CommonFields):
 
         Iterates over every attribute in ``template.attribute_templates``,
         runs the value through
-        :class:`~recap.schemas.attribute.AttributeTemplateValidator`, and
+        :func:`~recap.schemas.attribute.coerce_value`, and
         rebuilds ``values`` with the coerced results.  Raises
         :class:`ValueError` if any unknown keys are present.
         """
         # Build template lookup: attr name -> template schema
-        tmpl_by_name = {a.name: a for a in self.template.attribute_templates}
+        tmpl_by_name = self.template.by_name()
 
         values_dict = (
             self.values.model_dump(by_alias=True)
@@ -218,15 +205,15 @@ class ParameterSchema(CommonFields):
             else dict(self.values)
         )
 
-        # 1) no unknown keys
-        unknown_keys = set(values_dict) - set(tmpl_by_name)
+        # Reject unknown keys before coercing anything, so that error is
+        # reported ahead of any coercion failure.
+        unknown_keys = values_dict.keys() - tmpl_by_name.keys()
         if unknown_keys:
             raise ValueError(
                 f"Unknown parameter(s) for template {self.template.name}: "
                 f"{', '.join(sorted(unknown_keys))}"
             )
 
-        # 2) coerce each value using your AttributeTemplateValidator
         coerced: dict[str, Any] = {}
         for name, raw_value in values_dict.items():
             attr_tmpl = tmpl_by_name[name]
@@ -236,17 +223,15 @@ class ParameterSchema(CommonFields):
             else:
                 raw_unit = None
 
-            # Reuse your validator to perform type coercion & checks
-            # Note: we shove `raw_value` into 'default' to leverage coerce_default()
-            validator = AttributeTemplateValidator(
-                name=attr_tmpl.name,
-                type=attr_tmpl.value_type,
-                unit=attr_tmpl.unit,
-                metadata=_attr_metadata(attr_tmpl),
-                default=raw_value,
+            value_type = attr_tmpl.value_type
+            # Only enum coercion consults the template metadata.
+            value = coerce_value(
+                value_type,
+                raw_value,
+                attribute_metadata(attr_tmpl) if value_type == "enum" else None,
             )
             coerced[name] = {
-                "value": validator.default,  # already converted by coerce_default
+                "value": value,
                 "unit": attr_tmpl.unit if raw_unit is None else raw_unit,
             }
 
@@ -371,6 +356,12 @@ class StepSchema(CommonFields):
     def generate_child(self):
         return self.model_copy(deep=True, update={"id": None, "parent_id": self.id})
 
+    @classmethod
+    def validate_list(cls, rows: Any) -> list["StepSchema"]:
+        """Validate a batch of ORM steps in one call through a shared
+        ``TypeAdapter(list[StepSchema])``."""
+        return _step_list_adapter().validate_python(rows, from_attributes=True)
+
     @model_validator(mode="after")
     def build_parameter_model(self) -> "StepSchema":
         if isinstance(self.parameters, BaseModel):
@@ -394,4 +385,8 @@ class StepSchema(CommonFields):
         return self
 
 
-StepSchema.model_rebuild()
+@lru_cache(maxsize=1)
+def _step_list_adapter() -> TypeAdapter[list[StepSchema]]:
+    # Built lazily so importing this module does not force StepSchema's
+    # deferred schema build.
+    return TypeAdapter(list[StepSchema])
@@ -6,13 +6,13 @@ from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 
 from recap.client.base_client import RecapClient
-from recap.db.base import Base
+from recap.db.resource import ResourceType
+from recap.utils.database import get_or_create
 from recap.utils.migrations import apply_migrations as upgrade_database
-from recap.utils.migrations import downgrade_migrations
 
 
 @contextmanager
-def count_statements(target):
+def count_statements(target, selects_only=False):
     """Count SQL statements executed against ``target`` within the block.
 
     ``target`` may be an :class:`~sqlalchemy.engine.Engine`, a
@@ -20,7 +20,8 @@ def count_statements(target):
     ``engine`` attribute (e.g. a :class:`RecapClient`).  Yields a mutable
     counter dict with a single ``"n"`` key so callers can assert a bounded
     statement count and verify that N+1 / redundant-round-trip regressions
-    have not crept back in.
+    have not crept back in.  With ``selects_only=True`` only reads
+    (``SELECT`` and ``WITH`` statements) are counted.
 
     Example::
 
@@ -32,6 +33,10 @@ def count_statements(target):
     counter = {"n": 0}
 
     def _before(conn, cursor, statement, parameters, context, executemany):
+        if selects_only and not statement.lstrip().upper().startswith(
+            ("SELECT", "WITH")
+        ):
+            return
         counter["n"] += 1
 
     event.listen(engine, "before_cursor_execute", _before)
@@ -48,23 +53,27 @@ def statement_counter():
 
 
 @pytest.fixture(scope="session")
-def db_url(tmp_path_factory):
-    db_dir = tmp_path_factory.mktemp("data")
-    db_path = db_dir / "test.db"
-    return f"sqlite:///{db_path}"
+def db_url():
+    # Shared-cache memory databases are private to the process, so each
+    # pytest-xdist worker (``pytest -n auto``) already gets its own copy.
+    return "sqlite:///file:recap_test?mode=memory&cache=shared&uri=true"
 
 
 @pytest.fixture(scope="session")
-def apply_migrations(db_url):
+def apply_migrations(db_url, engine):
     """
     Run alembic migrations once before all tests.
     """
+    # A shared-cache in-memory database lives only while a connection is
+    # open; hold one for the whole session.
+    keeper = engine.connect()
     upgrade_database(db_url)
 
     yield
 
-    # Optional cleanup for SQLite or temporary DB
-    downgrade_migrations(db_url)
+    # Closing the last connection discards the in-memory database, so there
+    # is no need to run every down-migration first.
+    keeper.close()
 
 
 @pytest.fixture(scope="session")
@@ -78,14 +87,6 @@ def engine(db_url):
     engine.dispose()
 
 
-@pytest.fixture(scope="session")
-def setup_database(engine):
-    """Create all tables"""
-    Base.metadata.create_all(bind=engine)
-    yield
-    Base.metadata.drop_all(bind=engine)
-
-
 @pytest.fixture(scope="function")
 def db_session(apply_migrations, engine):
     """Create a new database session"""
@@ -109,6 +110,16 @@ def db_session(apply_migrations, engine):
     connection.close()
 
 
+@pytest.fixture(scope="function")
+def container_type(db_session):
+    """The ``container`` resource type, created in ``db_session`` so it is
+    rolled back with the rest of the test."""
+    container_type, _ = get_or_create(
+        db_session, ResourceType, where={"name": "container"}
+    )
+    return container_type
+
+
 @pytest.fixture(scope="function")
 def client(db_url, apply_migrations):
     # client = RecapClient(url=db_url)
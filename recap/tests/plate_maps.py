@@ -0,0 +1,14 @@
+from recap.utils.general import generate_uppercase_alphabets
+
+LIB_WELL_NAMES_1536 = tuple(
+    f"{i}{j:02d}" for i in generate_uppercase_alphabets(32) for j in range(1, 49)
+)
+# (echo source position, xtal shifter well) pairs for the 192-well xtal plate
+SHIFTER_SUFFIXES = tuple(f"{k}{s}" for s in "ab" for k in range(1, 13))
+XTAL_PLATE_MAP = tuple(
+    zip(
+        (f"{i}{j}" for i in generate_uppercase_alphabets(16) for j in range(1, 13)),
+        (f"{i}{s}" for i in generate_uppercase_alphabets(8) for s in SHIFTER_SUFFIXES),
+        strict=True,
+    )
+)
@@ -1,4 +1,5 @@
 import pytest
+from sqlalchemy import inspect, select
 
 from recap.adapter.local import LocalBackend
 from recap.db.attribute import AttributeGroupTemplate, AttributeTemplate, AttributeValue
@@ -33,6 +34,31 @@ def test_attribute_value_coercion_and_json_storage(db_session):
     assert av.value_json == 12
 
 
+def test_attribute_value_metadata_is_deferred(db_session):
+    tmpl = ResourceTemplate(name="Deferred")
+    group = AttributeGroupTemplate(name="Specs", resource_template=tmpl)
+    AttributeTemplate(
+        name="Voltage",
+        value_type="int",
+        default_value=1,
+        attribute_group_template=group,
+    )
+    db_session.add_all([tmpl, group])
+    db_session.flush()
+    res = Resource(name="R-deferred", template=tmpl)
+    db_session.add(res)
+    db_session.flush()
+    attr_id = tmpl.attribute_group_templates[0].attribute_templates[0].id
+    db_session.expunge_all()
+
+    av = db_session.scalars(
+        select(AttributeValue).where(AttributeValue.attribute_template_id == attr_id)
+    ).one()
+    assert "metadata_json" in inspect(av).unloaded
+    assert av.value_json == 1
+    assert av.metadata_json == {}
+
+
 def test_attribute_value_requires_target_owner(db_session):
     tmpl = ResourceTemplate(name="SpecsTemplate")
     group = AttributeGroupTemplate(name="Specs", resource_template=tmpl)
@@ -125,3 +151,19 @@ def test_add_attr_group_reuses_existing_group(db_session):
     second = backend.add_attr_group("content", ref)
 
     assert first.id == second.id
+
+
+def test_enum_attribute_without_default_rejected_on_create(db_session):
+    tmpl = ResourceTemplate(name="EnumyNoDefault")
+    group = AttributeGroupTemplate(name="Choices", resource_template=tmpl)
+    AttributeTemplate(
+        name="Position",
+        value_type="enum",
+        metadata_json={"choices": {"u": {}, "d": {}}},
+        attribute_group_template=group,
+    )
+    db_session.add_all([tmpl, group])
+    db_session.flush()
+
+    with pytest.raises(ValueError, match="Position must be one of u, d"):
+        Resource(name="R", template=tmpl)
@@ -324,6 +324,95 @@ def test_resource_template_builder_on_existing_silent_suppresses_warning(client)
     ]
 
 
+def test_add_children_bulk_matches_add_child(client):
+    props = {
+        "content": [
+            {"name": "volume", "type": "float", "default": 5, "unit": "uL"},
+            {"name": "tags", "type": "array", "default": ["a"]},
+        ]
+    }
+    with client.build_resource_template(
+        name="BulkRT", type_names=["container", "plate"]
+    ) as rtb:
+        rtb.add_child("W1", ["container", "well"]).add_properties(props).close_child()
+        rtb.add_children_bulk(
+            [
+                {"name": name, "type_names": ["container", "well"], "properties": props}
+                for name in ("W2", "W3")
+            ]
+        )
+        model = rtb.get_model()
+
+    def _shape(child):
+        return (
+            child.version,
+            sorted(t.name for t in child.types),
+            {
+                g.name: sorted(
+                    (a.name, a.value_type, a.unit, a.default_value)
+                    for a in g.attribute_templates
+                )
+                for g in child.attribute_group_templates
+            },
+        )
+
+    assert set(model.children) == {"W1", "W2", "W3"}
+    assert _shape(model.children["W2"]) == _shape(model.children["W1"])
+    assert _shape(model.children["W3"]) == _shape(model.children["W1"])
+    assert [model.children[n].slug for n in ("W1", "W2", "W3")] == ["w1", "w2", "w3"]
+
+    with (
+        pytest.raises(ExistingResourceTemplateError, match="W2"),
+        client.build_resource_template(
+            resource_template_id=model.id, on_existing="raise"
+        ) as strict,
+    ):
+        strict.add_children_bulk(
+            [
+                {"name": "W4", "type_names": ["container", "well"]},
+                {"name": "W2", "type_names": ["container", "well"]},
+            ]
+        )
+    with client.build_resource_template(resource_template_id=model.id) as rtb:
+        assert set(rtb.get_model().children) == {"W1", "W2", "W3"}
+
+
+def test_add_children_bulk_repeated_row_follows_on_existing(client):
+    """A name repeated inside one batch is handled like an existing child,
+    not left to the database's unique constraint."""
+    rows = [
+        {"name": "A", "type_names": ["container", "well"]},
+        {"name": "A", "type_names": ["container", "well"]},
+    ]
+
+    with (
+        pytest.warns(ExistingResourceTemplateWarning, match="'A'"),
+        client.build_resource_template(
+            name="BulkDupWarn", type_names=["container", "plate"]
+        ) as rtb,
+    ):
+        rtb.add_children_bulk(rows)
+        assert list(rtb.get_model().children) == ["A"]
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        with client.build_resource_template(
+            name="BulkDupSilent",
+            type_names=["container", "plate"],
+            on_existing="silent",
+        ) as rtb:
+            rtb.add_children_bulk(rows)
+            assert list(rtb.get_model().children) == ["A"]
+
+    with (
+        pytest.raises(ExistingResourceTemplateError, match="'A'"),
+        client.build_resource_template(
+            name="BulkDupRaise", type_names=["container", "plate"], on_existing="raise"
+        ) as rtb,
+    ):
+        rtb.add_children_bulk(rows)
+
+
 def test_process_template_silent_reuse_same_steps_idempotent(client):
     """Re-registering the exact same template structure with
     on_existing='silent' must be a no-op — no IntegrityError, no duplicates.
@@ -12,9 +12,24 @@ from recap.db.process import (
 )
 from recap.db.resource import Resource, ResourceTemplate, ResourceType
 from recap.db.step import StepTemplate, StepTemplateResourceSlotBinding
+from recap.schemas.resource import ResourceSchema
 from recap.utils.general import make_slug
 
 
+@pytest.mark.parametrize(
+    ("name", "slug"),
+    [
+        ("volume", "volume"),
+        ("a__b", "a__b"),
+        ("Drop Position", "drop_position"),
+        ("café", "cafe"),
+        ("96 well", "_96_well"),
+    ],
+)
+def test_make_slug(name, slug):
+    assert make_slug(name) == slug
+
+
 def test_attribute_group_template_slug_and_constraint(db_session):
     process_template = ProcessTemplate(name="Pipeline", version="v1")
     step_template = StepTemplate(name="Prep", process_template=process_template)
@@ -199,6 +214,27 @@ def test_resource_children_respect_max_depth(db_session):
     assert resource.children == {}
 
 
+def test_resource_schema_respects_max_depth_context(db_session):
+    tmpl = ResourceTemplate(name="Rack")
+    shelf = ResourceTemplate(name="Shelf", parent=tmpl)
+    ResourceTemplate(name="Box", parent=shelf)
+    db_session.add(tmpl)
+    db_session.flush()
+
+    resource = Resource(name="Rack 1", template=tmpl)
+    db_session.add(resource)
+    db_session.flush()
+
+    full = ResourceSchema.model_validate(resource)
+    assert set(full.children["Shelf"].children) == {"Box"}
+
+    context = {"max_depth": 1}
+    limited = ResourceSchema.model_validate(resource, context=context)
+    assert set(limited.children) == {"Shelf"}
+    assert limited.children["Shelf"].children == {}
+    assert context == {"max_depth": 1}
+
+
 def test_property_values_reject_unknown_keys(db_session):
     tmpl = ResourceTemplate(name="Machine")
     group = AttributeGroupTemplate(name="Props", resource_template=tmpl)
@@ -1,12 +1,16 @@
 from sqlalchemy import select
+from sqlalchemy.orm import sessionmaker
 
+from recap.adapter.local import LocalBackend
 from recap.db.campaign import Campaign
 from recap.db.step import StepTemplate
-from recap.utils.database import get_or_create
-from recap.utils.general import generate_uppercase_alphabets
+from recap.schemas.attribute import AttributeTemplateValidator
+from recap.schemas.resource import ResourceTemplateRef, ResourceTypeSchema
 
+from .plate_maps import LIB_WELL_NAMES_1536, XTAL_PLATE_MAP
 
-def test_fragment_screening(db_session):
+
+def test_fragment_screening(db_session, container_type):
     from recap.db.attribute import (
         AttributeGroupTemplate,
         AttributeTemplate,
@@ -16,7 +20,6 @@ def test_fragment_screening(db_session):
     from recap.db.resource import (
         Resource,
         ResourceTemplate,
-        ResourceType,
     )
 
     """
@@ -39,12 +42,6 @@ def test_fragment_screening(db_session):
         - Create Process from template
         - Add resources to the process
     """
-    # Create container Resource type
-    # container_type = ResourceType(name="container")
-    container_type, _ = get_or_create(
-        db_session, ResourceType, where={"name": "container"}
-    )
-
     # Create a library plate template
     lib_plate_1536_template = ResourceTemplate(
         name="Library Plate 1536", types=[container_type]
@@ -68,7 +65,7 @@ def test_fragment_screening(db_session):
 
     lib_plate_1536_template.attribute_group_templates.append(plate_dimensions_attr)
     db_session.add(lib_plate_1536_template)
-    db_session.commit()
+    db_session.flush()
     statement = select(ResourceTemplate).where(
         ResourceTemplate.name == "Library Plate 1536"
     )
@@ -81,38 +78,43 @@ def test_fragment_screening(db_session):
     )
 
     # Create library well templates and associate with plate template
-    a_to_af = generate_uppercase_alphabets(32)
-    lib_well_type_names_1536 = [
-        {"name": f"{i}{str(j).zfill(2)}"} for i in a_to_af for j in range(1, 49)
-    ]
-
-    # Well attributes
-    used = AttributeGroupTemplate(
-        name="well_status",
-    )
-    used_value = AttributeTemplate(name="used", value_type="bool", default_value="true")
-    used.attribute_templates.append(used_value)
-    content_attr = AttributeGroupTemplate(
-        name="content",
-    )
-    catalog_id = AttributeTemplate(
-        name="catalog_id", value_type="str", default_value=""
-    )
-    smiles = AttributeTemplate(name="SMILES", value_type="str", default_value="")
-    sequence = AttributeTemplate(name="sequence", value_type="int", default_value="0")
-
-    content_attr.attribute_templates.append(catalog_id)
-    content_attr.attribute_templates.append(smiles)
-    content_attr.attribute_templates.append(sequence)
-
-    for well_data in lib_well_type_names_1536:
-        well = ResourceTemplate(name=well_data["name"], types=[container_type])
-        well.attribute_group_templates.append(used)
-        well.attribute_group_templates.append(content_attr)
-        db_session.add(well)
-        lib_plate_1536_template.children[well.name] = well
-
-    db_session.commit()
+    # Well attributes, shared by every well so the bulk insert expands them
+    # into group and attribute rows once
+    well_properties = {
+        "well_status": [
+            AttributeTemplateValidator(name="used", type="bool", default=True),
+        ],
+        "content": [
+            AttributeTemplateValidator(name="catalog_id", type="str", default=""),
+            AttributeTemplateValidator(name="SMILES", type="str", default=""),
+            AttributeTemplateValidator(name="sequence", type="int", default=0),
+        ],
+    }
+    well_types = [ResourceTypeSchema.model_validate(container_type)]
+
+    # Insert the 1536 well templates, their type links and per-well property
+    # groups through the backend's bulk path. Its sessions share the test
+    # connection, so they see the plate above and roll back with the test.
+    backend = LocalBackend(sessionmaker(bind=db_session.connection()))
+    uow = backend.begin()
+    try:
+        skipped = backend.add_child_resource_templates(
+            [
+                {
+                    "name": name,
+                    "version": "1.0",
+                    "types": well_types,
+                    "properties": well_properties,
+                }
+                for name in LIB_WELL_NAMES_1536
+            ],
+            ResourceTemplateRef.model_validate(lib_plate_1536_template),
+        )
+        uow.commit()
+    except Exception:
+        uow.rollback()
+        raise
+    assert skipped == []
     statement = select(ResourceTemplate).where(
         ResourceTemplate.name == "Library Plate 1536"
     )
@@ -125,11 +127,16 @@ def test_fragment_screening(db_session):
         template=lib_plate_1536_template,
     )
     db_session.add(lib_plate)
-    db_session.commit()
+    db_session.flush()
 
     statement = select(Resource).where(Resource.name == "Test LP1536")
     lib_plate = db_session.scalars(statement).one()
     assert lib_plate.children["A01"].template.name == "A01"
+    assert len(lib_plate.children) == 1536
+    for well_name in ("A01", "AF48"):
+        well = lib_plate.children[well_name]
+        assert set(well.properties) == {"well_status", "content"}
+        assert well.properties["well_status"].values["used"] is True
     assert lib_plate.properties["LB1536_dimensions"].values["rows"] == 32
 
     from recap.db.attribute import (
@@ -142,14 +149,6 @@ def test_fragment_screening(db_session):
 
     # - Create an xtal plate template
     xtal_plate_type = ResourceTemplate(name="SwissCI-MRC-2d", types=[container_type])
-    a_to_h = generate_uppercase_alphabets(8)
-    a_to_p = generate_uppercase_alphabets(16)
-
-    echo = [f"{i}{j}" for i in a_to_p for j in range(1, 13)]
-    shifter = [f"{i}{k}{j}" for i in a_to_h for j in ["a", "b"] for k in range(1, 13)]
-    plate_maps = [
-        {"echo": i, "shifter": j} for i, j in zip(echo, shifter, strict=False)
-    ]
 
     well_position = AttributeGroupTemplate(name="well_position")
     well_pos_x = AttributeTemplate(name="x", value_type="int", default_value="0")
@@ -168,22 +167,19 @@ def test_fragment_screening(db_session):
     well_position.attribute_templates.append(well_pos_y_offset_1350)
 
     # - Create xtal well type template and associate with xtal template
-    for plate_map in plate_maps:
+    for echo, shifter in XTAL_PLATE_MAP:
         echo_pos_attr = AttributeGroupTemplate(name="echo_pos")
         x_offset = well_pos_x
-        if plate_map["shifter"][-1] == "b":
-            y_offset = well_pos_y_offset_0
-        else:
-            y_offset = well_pos_y_offset_1350
+        y_offset = well_pos_y_offset_0 if shifter[-1] == "b" else well_pos_y_offset_1350
 
         xtal_well_type = ResourceTemplate(
-            name=plate_map["shifter"],
+            name=shifter,
             types=[container_type],
         )
         echo_pos = AttributeTemplate(
-            name=f"echo_pos_{plate_map['echo']}",
+            name=f"echo_pos_{echo}",
             value_type="str",
-            default_value=plate_map["echo"],
+            default_value=echo,
         )
         xtal_well_type.attribute_group_templates.append(echo_pos_attr)
         echo_pos_attr.attribute_templates.append(x_offset)
@@ -194,7 +190,7 @@ def test_fragment_screening(db_session):
     # - Create Xtal plate resource
     xtal_plate = Resource(name="TestXtalPlate", template=xtal_plate_type)
     db_session.add(xtal_plate)
-    db_session.commit()
+    db_session.flush()
 
     statement = select(Resource).where(Resource.name == "TestXtalPlate")
     xtal_plate = db_session.scalars(statement).one()
@@ -233,7 +229,7 @@ def test_fragment_screening(db_session):
     process_template.resource_slots.append(xtal_plate_resource_slot)
     process_template.resource_slots.append(puck_tray_resource_slot)
     db_session.add(process_template)
-    db_session.commit()
+    db_session.flush()
 
     statement = select(ProcessTemplate).where(
         ProcessTemplate.name == "Fragment Screening Sample Prep"
@@ -250,7 +246,7 @@ def test_fragment_screening(db_session):
         template=puck_collection_template,
     )
     db_session.add(puck_collection)
-    db_session.commit()
+    db_session.flush()
 
     #     - Create Step templates and connect them to resource slots
     # Steps for fragment screening
@@ -320,7 +316,7 @@ def test_fragment_screening(db_session):
     db_session.add(image_plate_template)
     db_session.add(echo_tx_template)
     db_session.add(harvesting_step_template)
-    db_session.commit()
+    db_session.flush()
 
     process_template.step_templates[image_plate_template.name] = image_plate_template
     process_template.step_templates[echo_tx_template.name] = echo_tx_template
@@ -328,7 +324,7 @@ def test_fragment_screening(db_session):
         harvesting_step_template
     )
     db_session.add(process_template)
-    db_session.commit()
+    db_session.flush()
 
     campaign = Campaign(name="Test campaign", proposal="111")
 
@@ -1,4 +1,18 @@
-from recap.utils.general import Direction, generate_uppercase_alphabets
+from recap.utils.general import Direction
+
+from .plate_maps import LIB_WELL_NAMES_1536, XTAL_PLATE_MAP
+
+# Shared by every library well so add_children_bulk expands it only once
+LIB_WELL_PROPERTIES = {
+    "well_status": [
+        {"name": "used", "type": "bool", "default": False},
+    ],
+    "content": [
+        {"name": "catalog_id", "type": "str", "default": ""},
+        {"name": "SMILES", "type": "str", "default": ""},
+        {"name": "sequence", "type": "int", "default": 0},
+    ],
+}
 
 
 def test_fragment_screening_api(client):
@@ -30,23 +44,16 @@ def test_fragment_screening_api(client):
             }
         )
 
-        a_to_af = generate_uppercase_alphabets(32)
-        lib_well_type_names_1536 = [
-            {"name": f"{i}{str(j).zfill(2)}"} for i in a_to_af for j in range(1, 49)
-        ]
-        for well_data in lib_well_type_names_1536:
-            lp.add_child(well_data["name"], ["container", "well"]).add_properties(
+        lp.add_children_bulk(
+            [
                 {
-                    "well_status": [
-                        {"name": "used", "type": "bool", "default": False},
-                    ],
-                    "content": [
-                        {"name": "catalog_id", "type": "str", "default": ""},
-                        {"name": "SMILES", "type": "str", "default": ""},
-                        {"name": "sequence", "type": "int", "default": 0},
-                    ],
+                    "name": well_name,
+                    "type_names": ["container", "well"],
+                    "properties": LIB_WELL_PROPERTIES,
                 }
-            ).close_child()
+                for well_name in LIB_WELL_NAMES_1536
+            ]
+        )
 
     rt = (
         client.query_maker()
@@ -59,15 +66,6 @@ def test_fragment_screening_api(client):
     with client.build_resource_template(
         name="SwissCI-MRC-2d", type_names=["container", "xtal_plate", "plate"]
     ) as plate:
-        a_to_h = generate_uppercase_alphabets(8)
-        a_to_p = generate_uppercase_alphabets(16)
-        echo = [f"{i}{j}" for i in a_to_p for j in range(1, 13)]
-        shifter = [
-            f"{i}{k}{j}" for i in a_to_h for j in ["a", "b"] for k in range(1, 13)
-        ]
-        plate_maps = [
-            {"echo": i, "shifter": j} for i, j in zip(echo, shifter, strict=False)
-        ]
         # plate.prop_group("metadata").add_attribute("drop_volume", "int", "nL", 0).close_group()
         plate.add_properties(
             {
@@ -76,25 +74,30 @@ def test_fragment_screening_api(client):
                 ]
             }
         )
-        for plate_map in plate_maps:
-            plate_shift_b = plate_map["shifter"][-1] == "b"
-            plate.add_child(plate_map["shifter"], ["container", "well"]).add_properties(
+        plate.add_children_bulk(
+            [
                 {
-                    "echo_offset": [
-                        {"name": "x", "type": "int", "default": 0},
-                        {
-                            "name": "y_0" if plate_shift_b else "y_1350",
-                            "type": "int",
-                            "default": 0 if plate_shift_b else 1350,
-                        },
-                        {
-                            "name": f"echo_pos_{plate_map['echo']}",
-                            "type": "str",
-                            "default": plate_map["echo"],
-                        },
-                    ]
+                    "name": shifter,
+                    "type_names": ["container", "well"],
+                    "properties": {
+                        "echo_offset": [
+                            {"name": "x", "type": "int", "default": 0},
+                            {
+                                "name": "y_0" if shifter[-1] == "b" else "y_1350",
+                                "type": "int",
+                                "default": 0 if shifter[-1] == "b" else 1350,
+                            },
+                            {
+                                "name": f"echo_pos_{echo}",
+                                "type": "str",
+                                "default": echo,
+                            },
+                        ]
+                    },
                 }
-            ).close_child()
+                for echo, shifter in XTAL_PLATE_MAP
+            ]
+        )
 
     rt = (
         client.query_maker()
@@ -0,0 +1,25 @@
+from sqlalchemy import create_engine, inspect
+
+from recap.db.base import Base
+from recap.utils.migrations import apply_migrations, downgrade_migrations
+
+
+def test_migrations_round_trip(tmp_path):
+    """Every revision upgrades and downgrades cleanly: head -> base -> head."""
+    db_url = f"sqlite:///{tmp_path / 'migrations.db'}"
+    engine = create_engine(db_url)
+    try:
+        apply_migrations(db_url)
+        assert set(Base.metadata.tables) <= set(inspect(engine).get_table_names())
+
+        downgrade_migrations(db_url)
+        assert set(inspect(engine).get_table_names()) <= {"alembic_version"}
+
+        apply_migrations(db_url)
+        inspector = inspect(engine)
+        assert set(Base.metadata.tables) <= set(inspector.get_table_names())
+        assert "ix_resource_parent_id" in {
+            index["name"] for index in inspector.get_indexes("resource")
+        }
+    finally:
+        engine.dispose()
@@ -27,11 +27,12 @@ def test_platemate_via_client_child_steps(client):  # noqa
                 ]
             }
         )
-        for idx, well in enumerate(lib_wells, start=1):
-            (
-                lp.add_child(well, ["container", "well"])
-                .add_properties(
-                    {
+        lp.add_children_bulk(
+            [
+                {
+                    "name": well,
+                    "type_names": ["container", "well"],
+                    "properties": {
                         "status": [
                             {"name": "used", "type": "bool", "default": False},
                         ],
@@ -40,10 +41,11 @@ def test_platemate_via_client_child_steps(client):  # noqa
                             {"name": "smiles", "type": "str", "default": ""},
                             {"name": "sequence", "type": "int", "default": idx},
                         ],
-                    }
-                )
-                .close_child()
-            )
+                    },
+                }
+                for idx, well in enumerate(lib_wells, start=1)
+            ]
+        )
 
     with client.build_resource_template(
         name="PM Xtal Plate", type_names=["container", "xtal_plate", "plate"]
@@ -66,12 +68,12 @@ def test_platemate_via_client_child_steps(client):  # noqa
             {"name": "A2a", "echo": "A3", "drop": "dr", "origin_y": 0},
         ]
         drop_offsets = {"c": (0, 0), "lu": (-300, 300), "dr": (300, -300)}
-        for m in mapping:
-            x_off, y_off = drop_offsets[m["drop"]]
-            (
-                xt.add_child(m["name"], ["container", "well"])
-                .add_properties(
-                    {
+        xt.add_children_bulk(
+            [
+                {
+                    "name": m["name"],
+                    "type_names": ["container", "well"],
+                    "properties": {
                         "mapping": [
                             {
                                 "name": "echo_position",
@@ -87,13 +89,22 @@ def test_platemate_via_client_child_steps(client):  # noqa
                         ],
                         "drop": [
                             {"name": "code", "type": "str", "default": m["drop"]},
-                            {"name": "x_offset", "type": "int", "default": x_off},
-                            {"name": "y_offset", "type": "int", "default": y_off},
+                            {
+                                "name": "x_offset",
+                                "type": "int",
+                                "default": drop_offsets[m["drop"]][0],
+                            },
+                            {
+                                "name": "y_offset",
+                                "type": "int",
+                                "default": drop_offsets[m["drop"]][1],
+                            },
                         ],
-                    }
-                )
-                .close_child()
-            )
+                    },
+                }
+                for m in mapping
+            ]
+        )
 
     with client.build_resource_template(
         name="Puck Collection", type_names=["container", "puck_collection"]
@@ -104,20 +115,22 @@ def test_platemate_via_client_child_steps(client):  # noqa
     with client.build_resource_template(
         name="PM Puck", type_names=["container", "puck"]
     ) as pk:
-        for idx in range(1, 4):
-            (
-                pk.add_child(f"Pin-{idx}", ["container", "pin"])
-                .add_properties(
-                    {
+        pk.add_children_bulk(
+            [
+                {
+                    "name": f"Pin-{idx}",
+                    "type_names": ["container", "pin"],
+                    "properties": {
                         "mount": [
                             {"name": "position", "type": "int", "default": idx},
                             {"name": "sample_name", "type": "str", "default": ""},
                             {"name": "departure", "type": "datetime", "default": None},
                         ]
-                    }
-                )
-                .close_child()
-            )
+                    },
+                }
+                for idx in range(1, 4)
+            ]
+        )
 
     # Process template
     with client.build_process_template("PM Workflow", "1.0") as pt:
@@ -161,6 +174,23 @@ def test_platemate_via_client_child_steps(client):  # noqa
 
     # Build puck collection and ensure duplicate child creation raises
     collection_ref = client.create_resource("Test Puck Collection", "Puck Collection")
+
+    # Ensure wells/pins are materialized
+    def seed_children(parent_name: str, parent_template: str, child_names: list[str]):
+        parent_ref = client.get_resource(parent_name, parent_template)
+        for child_name in child_names:
+            try:
+                client.get_resource(child_name, child_name)
+                continue
+            except Exception:
+                child_template = client.backend.get_resource_template(child_name)
+                client.backend.create_resource(
+                    child_name, child_template, parent_resource=parent_ref
+                )
+
+    # One transaction for the puck checks and the seeding. The duplicate
+    # names are rejected before anything is added to the session, so the
+    # failed creates need no savepoint.
     uow = client.backend.begin()
     try:
         puck_template = client.backend.get_resource_template("PM Puck")
@@ -177,56 +207,14 @@ def test_platemate_via_client_child_steps(client):  # noqa
             puck_template,
             parent_resource=collection_ref,
         )
+        seed_children("DSI-poised", "PM Library Plate", lib_wells)
+        xtal_child_names = [m["name"] for m in mapping]
+        seed_children("pmtest", "PM Xtal Plate", xtal_child_names)
         uow.commit()
     except Exception:
         uow.rollback()
         raise
 
-    def populate_children(resource_name: str, template_name: str):
-        """Ensure a resource has instantiated children from its template."""
-        uow_inner = client.backend.begin()
-        try:
-            res = client.get_resource(resource_name, template_name)
-            tmpl = client.backend.get_resource_template(template_name, expand=True)
-            # If children already exist, skip creation
-            existing_children = client.get_resource(
-                resource_name, template_name, expand=True
-            ).children
-            if existing_children:
-                uow_inner.commit()
-                return
-            for child_tmpl in tmpl.children.values():
-                client.backend.create_resource(
-                    child_tmpl.name, child_tmpl, parent_resource=res
-                )
-            uow_inner.commit()
-        except Exception:
-            uow_inner.rollback()
-            raise
-
-    # Ensure wells/pins are materialized
-    def seed_children(parent_name: str, parent_template: str, child_names: list[str]):
-        uow_seed = client.backend.begin()
-        try:
-            parent_ref = client.get_resource(parent_name, parent_template)
-            for child_name in child_names:
-                try:
-                    client.get_resource(child_name, child_name)
-                    continue
-                except Exception:
-                    child_template = client.backend.get_resource_template(child_name)
-                    client.backend.create_resource(
-                        child_name, child_template, parent_resource=parent_ref
-                    )
-            uow_seed.commit()
-        except Exception:
-            uow_seed.rollback()
-            raise
-
-    seed_children("DSI-poised", "PM Library Plate", lib_wells)
-    xtal_child_names = [m["name"] for m in mapping]
-    seed_children("pmtest", "PM Xtal Plate", xtal_child_names)
-
     # Process run + assignments
     with client.build_process_run(
         "pm-run", "Platemate via client", "PM Workflow", "1.0"
@@ -241,21 +229,19 @@ def test_platemate_via_client_child_steps(client):  # noqa
         prb.set_params(echo_params)
 
         # Child steps for echo transfer with step-level assignments (lib well -> xtal well)
-        xtal_wells = sorted(
+        xtal_wells = list(
             client.get_resource(
                 "pmtest", "PM Xtal Plate", expand=True
-            ).children.values(),
-            key=lambda w: w.name,
+            ).children.values()
         )
-        lib_children = sorted(
+        lib_children = list(
             client.get_resource(
                 "DSI-poised", "PM Library Plate", expand=True
-            ).children.values(),
-            key=lambda w: w.name,
+            ).children.values()
         )
         assert len(xtal_wells) == 3, "xtal wells not initialized"
         assert len(lib_children) == 3, "library wells not initialized"
-        echo_children_created = []
+        echo_transfer_steps = []
         for source, dest in zip(lib_children, xtal_wells, strict=False):
             # Generate a pydantic model for the child step
             echo_transfer_step = prb.get_model().steps["Echo Transfer"].generate_child()
@@ -266,10 +252,9 @@ def test_platemate_via_client_child_steps(client):  # noqa
             )
             echo_transfer_step.resources["source_plate"] = source
             echo_transfer_step.resources["dest_plate"] = dest
-            # Add it to the database
-            prb.add_child_step(echo_transfer_step)
-            echo_child = prb.add_child_step(echo_transfer_step)
-            echo_children_created.append(echo_child)
+            echo_transfer_steps.append(echo_transfer_step)
+        # Add them to the database in one batch
+        echo_children_created = prb.add_child_steps_bulk(echo_transfer_steps)
         assert len(echo_children_created) == 3
 
         # Child steps for harvesting with step-level assignments (well -> pin inside a puck collection)
@@ -281,26 +266,33 @@ def test_platemate_via_client_child_steps(client):  # noqa
             (p for p in puck_collection.children.values() if p.name == "FGZ003"), None
         )
         assert puck_with_pins is not None, "FGZ003 puck not initialized"
-        puck_pins = sorted(puck_with_pins.children.values(), key=lambda p: p.name)
+        puck_pins = list(puck_with_pins.children.values())
         assert len(puck_pins) >= 2, "puck pins not initialized"
-        harvest_children_created = []
-
-        for idx, dest in enumerate(xtal_wells[:2]):
-            arrival = base_time + timedelta(minutes=5 + idx * 10)
-            departure = arrival + timedelta(minutes=5)
+        # (arrival, departure, sample) per harvested well, shared with the
+        # manifest below
+        schedule = [
+            (
+                base_time + timedelta(minutes=5 + idx * 10),
+                base_time + timedelta(minutes=10 + idx * 10),
+                f"mpro-{idx + 1:02d}",
+            )
+            for idx in range(2)
+        ]
+        harvest_steps = []
+        for idx, ((arrival, departure, sample), dest) in enumerate(
+            zip(schedule, xtal_wells, strict=False)
+        ):
             harvest_step = prb._process_run.steps["Harvesting"].generate_child()
             harvest_step.parameters.harvest.values.arrival.value = arrival
             harvest_step.parameters.harvest.values.departure.value = departure
-            harvest_step.parameters.harvest.values.lsdc_name.value = (
-                f"mpro-{idx + 1:02d}"
-            )
+            harvest_step.parameters.harvest.values.lsdc_name.value = sample
             harvest_step.parameters.harvest.values.harvested.value = True
             harvest_step.resources["source_plate"] = dest
             harvest_step.resources["dest_puck"] = puck_pins[idx]
-
-            harvest_child = prb.add_child_step(harvest_step)
+            harvest_steps.append(harvest_step)
             lib_children[idx].properties["status"].values.used.value = True
-            harvest_children_created.append(harvest_child)
+
+        harvest_children_created = prb.add_child_steps_bulk(harvest_steps)
         assert len(harvest_children_created) == 2
 
     # Echo rows derived from echo child steps + mapping properties
@@ -326,14 +318,14 @@ def test_platemate_via_client_child_steps(client):  # noqa
     # Harvest manifest via child steps
     manifest = []
     summary = []
-    for idx, dest in enumerate(xtal_wells[:2]):
-        arrival = base_time + timedelta(minutes=5 + idx * 10)
-        departure = arrival + timedelta(minutes=5)
+    for idx, ((arrival, departure, sample), dest) in enumerate(
+        zip(schedule, xtal_wells, strict=False)
+    ):
         catalog = f"CAT-{lib_children[idx].name}"
         lib_children[idx].properties["content"].values.catalog_id.value = catalog
         manifest.append(
             {
-                "sample": f"mpro-{idx + 1:02d}",
+                "sample": sample,
                 "arrival": arrival,
                 "departure": departure,
                 "source": dest.name,
@@ -342,7 +334,7 @@ def test_platemate_via_client_child_steps(client):  # noqa
         )
         summary.append(
             {
-                "sample": f"mpro-{idx + 1:02d}",
+                "sample": sample,
                 "catalog": catalog,
                 "smiles": lib_children[idx].properties["content"].values.smiles.value,
                 "soak_min": round((departure - base_time).total_seconds() / 60, 1),
@@ -358,6 +350,5 @@ def test_platemate_via_client_child_steps(client):  # noqa
     assert summary[1]["dest_resource"] == "Pin-2"
 
     # API gaps to consider:
-    # - bulk child creation in resource builders
     # - helper to map source/dest children (library wells -> xtal wells)
     # - helper to export echo CSV/harvest manifests from a process_run
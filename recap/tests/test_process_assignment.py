@@ -100,3 +100,29 @@ def test_assign_resource_prevents_duplicate_slot_usage(backend):
             ResourceSchema.model_validate(res2, from_attributes=True),
             run_schema,
         )
+
+
+def test_assign_resource_returns_same_schema_as_model_validate(backend):
+    rt = ResourceType(name="rt4")
+    pt = ProcessTemplate(name="PT4", version="1")
+    slot = ResourceSlot(
+        name="slot-w", process_template=pt, resource_type=rt, direction=Direction.input
+    )
+    tmpl = ResourceTemplate(name="RT4", types=[rt])
+    res = Resource(name="R-assign", template=tmpl)
+    camp = Campaign(name="C4", proposal="p4", saf=None, meta_data=None)
+    run = ProcessRun(name="run4", description="", template=pt, campaign=camp)
+
+    backend.session.add_all([rt, pt, slot, tmpl, res, camp, run])
+    backend.session.flush()
+
+    run_schema = backend.assign_resource(
+        ResourceSlotSchema.model_validate(slot),
+        ResourceSchema.model_validate(res, from_attributes=True),
+        ProcessRunSchema.model_validate(run, from_attributes=True),
+    )
+
+    assert run_schema.assigned_resources["slot-w"].resource.id == res.id
+    assert run_schema.model_dump() == (
+        ProcessRunSchema.model_validate(run, from_attributes=True).model_dump()
+    )
@@ -1,3 +1,6 @@
+from .conftest import count_statements
+
+
 def test_process_run_update_persists_param_changes(client):
     client.create_campaign("Campaign", "proposal-1", saf=None)
 
@@ -45,7 +48,69 @@ def test_resource_builder_persists_property_changes(client):
         rb.resource.properties.details.values.serial.value = "xyz"
 
     refreshed = (
-        client.query_maker().resources().include("properties").filter(name="R1").first()
+        client.query_maker().resources().include_properties().filter(name="R1").first()
     )
     assert refreshed is not None
     assert refreshed.properties.details.values.serial.value == "xyz"
+
+
+def test_process_run_builder_steps_lists_run_steps(client):
+    client.create_campaign("Campaign-steps", "proposal-steps", saf=None)
+
+    with client.build_process_template("PT-steps", "1.0") as ptb:
+        (
+            ptb.add_step("Mix")
+            .param_group("Inputs")
+            .add_attribute("Voltage", "int", "", "7")
+            .close_group()
+            .close_step()
+            .add_step("Heat")
+            .close_step()
+        )
+
+    with client.build_process_run(
+        name="run-steps",
+        description="desc",
+        template_name="PT-steps",
+        version="1.0",
+    ) as prb:
+        steps = {step.name: step for step in prb.steps}
+
+    assert set(steps) == {"Mix", "Heat"}
+    assert steps["Mix"].parameters.inputs.values.voltage.value == 7
+
+
+def _update_run_statements(client, n_steps):
+    name = f"PT-update-{n_steps}"
+    with client.build_process_template(name, "1.0") as ptb:
+        for idx in range(n_steps):
+            (
+                ptb.add_step(f"Step{idx}")
+                .param_group("Inputs")
+                .add_attribute("Voltage", "int", "", "0")
+                .close_group()
+                .close_step()
+            )
+
+    with client.build_process_run(
+        name=f"run-{name}",
+        description="desc",
+        template_name=name,
+        version="1.0",
+    ) as prb:
+        model = prb.get_model()
+
+    for step in model.steps.values():
+        step.parameters.inputs.values.voltage.value = 5
+    with count_statements(client) as counter:
+        client.backend.update_process_run(model)
+    return counter["n"]
+
+
+def test_process_run_update_loads_steps_once(client):
+    """update_process_run loads every step (with its parameter templates) in
+    one pass, so the statement count does not grow with the number of steps."""
+    client.create_campaign("Campaign-update-n", "proposal-n", saf=None)
+    n_two = _update_run_statements(client, 2)
+    n_four = _update_run_statements(client, 4)
+    assert n_two == n_four, f"2 steps={n_two} statements, 4 steps={n_four}"
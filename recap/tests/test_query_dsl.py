@@ -52,34 +52,44 @@ def seed_process_run(
             template=template,
             campaign=campaign,
         )
+        objects = [campaign, template, step_template, run]
 
-    db_session.add_all([campaign, template, step_template])
-    db_session.flush()
-
-    db_session.add(run)
-    db_session.flush()
+        if with_resource:
+            resource_type = ResourceType(name=f"resource-type-{uuid4().hex}")
+            resource_template = ResourceTemplate(
+                name=f"resource-template-{uuid4().hex}"
+            )
+            resource_template.types.append(resource_type)
+            slot = ResourceSlot(
+                name=f"slot-{name}",
+                process_template=template,
+                resource_type=resource_type,
+                direction=Direction.input,
+            )
+            resource = Resource(name=f"Resource-{name}", template=resource_template)
+            if bind_step_slot:
+                step_template.bindings["input_resource"] = (
+                    StepTemplateResourceSlotBinding(
+                        role="input_resource",
+                        resource_slot=slot,
+                    )
+                )
+            objects += [resource_type, resource_template, slot, resource]
 
+    db_session.add_all(objects)
     if with_resource:
-        resource_type = ResourceType(name=f"resource-type-{uuid4().hex}")
-        resource_template = ResourceTemplate(name=f"resource-template-{uuid4().hex}")
-        resource_template.types.append(resource_type)
-        slot = ResourceSlot(
-            name=f"slot-{name}",
-            process_template=template,
-            resource_type=resource_type,
-            direction=Direction.input,
-        )
-        resource = Resource(name=f"Resource-{name}", template=resource_template)
-        db_session.add_all([resource_type, resource_template, slot, resource])
+        # Run assignments key step-level assignments by slot id, so the slot
+        # needs its primary key before it is assigned.
         db_session.flush()
-        if bind_step_slot:
-            step_template.bindings["input_resource"] = StepTemplateResourceSlotBinding(
-                role="input_resource",
-                resource_slot=slot,
-            )
         run.resources[slot] = resource
 
-    db_session.commit()
+    # Keep the seeded objects loaded: tests read their ids and names right
+    # away, and expiring them would re-SELECT each one.
+    expire_on_commit, db_session.expire_on_commit = db_session.expire_on_commit, False
+    try:
+        db_session.commit()
+    finally:
+        db_session.expire_on_commit = expire_on_commit
     return campaign, run
 
 
@@ -297,6 +307,56 @@ def test_add_child_step_allows_descendant_of_slot_resource(db_session):
     assert created_child.resources["input_resource"].id == child_resource.id
 
 
+def test_add_child_steps_batches_children(db_session):
+    _, run = seed_process_run(
+        db_session,
+        name="child-batch",
+        with_resource=True,
+        bind_step_slot=True,
+    )
+
+    run_assignment = next(iter(run.assignments.values()))
+    wells = []
+    for i in range(3):
+        well = Resource(
+            name=f"batch-well-{i}", template=run_assignment.resource.template
+        )
+        well.parent = run_assignment.resource
+        wells.append(well)
+    db_session.add_all(wells)
+    db_session.commit()
+
+    SessionLocal = sessionmaker(bind=db_session.get_bind())
+    backend = LocalBackend(SessionLocal)
+
+    loaded_run = (
+        QueryDSL(backend)
+        .process_runs()
+        .filter(id=run.id)
+        .include_steps(include_parameters=False)
+        .include_resources()
+        .first()
+    )
+
+    assert loaded_run is not None
+    parent = loaded_run.steps["Step-child-batch"]
+    children = []
+    for well in wells:
+        child = parent.generate_child()
+        child.resources["input_resource"] = ResourceRef.model_validate(well)
+        children.append(child)
+
+    uow = backend.begin()
+    try:
+        created = backend.add_child_steps(loaded_run, children)
+    finally:
+        uow.rollback()
+
+    assert [c.resources["input_resource"].id for c in created] == [w.id for w in wells]
+    assert len({c.name for c in created}) == 3
+    assert all(c.parent_id == parent.id for c in created)
+
+
 def test_add_child_step_rejects_unrelated_resource(db_session):
     _, run = seed_process_run(
         db_session,
@@ -437,10 +497,7 @@ def test_resource_template_includes(db_session):
     assert any(t.name == "rt-inc" for t in tmpl.types)
 
 
-def test_resource_property_filtering_and_parent_scope(db_session):
-    container_type, _ = get_or_create(
-        db_session, ResourceType, where={"name": "container"}
-    )
+def test_resource_property_filtering_and_parent_scope(db_session, container_type):
     parent_tmpl = ResourceTemplate(name="Parent", version="1.0")
     parent_tmpl.types.append(container_type)
     child_tmpl = ResourceTemplate(name="Child", version="1.0", parent=parent_tmpl)
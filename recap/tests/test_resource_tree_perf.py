@@ -13,6 +13,9 @@ The key assertion is *depth-independence*: a 3-level and a 4-level chain must
 issue the **same** number of statements.
 """
 
+import pytest
+
+from recap.db.exceptions import ValidationError
 from recap.dsl.resource_builder import ResourceTemplateBuilder
 
 from .conftest import count_statements
@@ -105,3 +108,110 @@ def test_load_full_resource_tree_bounded_count(client):
     # template/attribute-group, not per resource). The pre-fix path issued one
     # lazy load per node; this asserts a depth-independent constant instead.
     assert counter["n"] <= 18, f"expected bounded count, got {counter['n']}"
+
+
+def _make_plate_template(client, name, n_wells):
+    with ResourceTemplateBuilder(
+        name=name, type_names=["container", "plate"], backend=client.backend
+    ) as rtb:
+        for idx in range(n_wells):
+            rtb.add_child(f"W{idx}", ["container", "well"]).add_properties(
+                {"content": [{"name": "volume", "type": "float", "default": 0}]}
+            ).close_child()
+
+
+def _create_from_template(client, name, template_name, expand=False):
+    uow = client.backend.begin()
+    try:
+        template = client.backend.get_resource_template(template_name)
+        client.backend.create_resource(name, template, expand=expand)
+        uow.commit()
+    except Exception:
+        uow.rollback()
+        raise
+
+
+def test_create_resource_template_walk_is_size_independent(client):
+    """Instantiating a resource must not lazy-load the template tree per node:
+    the number of SELECTs is the same for a 2-well and an 8-well plate."""
+    _make_plate_template(client, "TreePerfSmallPlate", 2)
+    _make_plate_template(client, "TreePerfLargePlate", 8)
+
+    with count_statements(client, selects_only=True) as small:
+        _create_from_template(client, "small", "TreePerfSmallPlate")
+    with count_statements(client, selects_only=True) as large:
+        _create_from_template(client, "large", "TreePerfLargePlate")
+    n_small, n_large = small["n"], large["n"]
+
+    assert n_small == n_large, (
+        f"template walk is size-dependent: 2 wells={n_small} selects, "
+        f"8 wells={n_large} selects"
+    )
+
+
+def test_create_resource_expanded_is_size_independent(client):
+    """Returning the expanded schema must not lazy-load template types or the
+    (empty) children of every new well."""
+    _make_plate_template(client, "TreePerfSmallPlateExp", 2)
+    _make_plate_template(client, "TreePerfLargePlateExp", 8)
+
+    with count_statements(client, selects_only=True) as small:
+        _create_from_template(client, "small-exp", "TreePerfSmallPlateExp", expand=True)
+    with count_statements(client, selects_only=True) as large:
+        _create_from_template(client, "large-exp", "TreePerfLargePlateExp", expand=True)
+    n_small, n_large = small["n"], large["n"]
+
+    assert n_small == n_large, (
+        f"expanded create is size-dependent: 2 wells={n_small} selects, "
+        f"8 wells={n_large} selects"
+    )
+
+
+def test_duplicate_child_name_rejected_before_template_walk(client):
+    """A child name already taken under the parent is rejected with one query,
+    before the template tree is loaded or any resource is built."""
+    _make_plate_template(client, "TreePerfDupPlate", 8)
+    # The plate's wells W0..W7 are created from the template
+    parent = client.create_resource("dup-parent", "TreePerfDupPlate")
+
+    uow = client.backend.begin()
+    try:
+        template = client.backend.get_resource_template("TreePerfDupPlate")
+        with (
+            count_statements(client) as counter,
+            pytest.raises(ValidationError, match="already exists under parent"),
+        ):
+            client.backend.create_resource("W3", template, parent_resource=parent)
+        assert counter["n"] == 1
+        assert not client.backend.session.new
+    finally:
+        uow.rollback()
+
+
+def test_expanded_children_come_back_name_ordered(client):
+    """Children come back ordered by name, both from a fresh
+    ``create_resource(expand=True)`` and when loaded back, so callers can use
+    ``children.values()`` directly (W10 sorts before W2, unlike the template
+    order)."""
+    _make_plate_template(client, "TreePerfOrderedPlate", 12)
+    expected = sorted(f"W{idx}" for idx in range(12))
+
+    created = client.create_resource("ordered", "TreePerfOrderedPlate")
+    assert list(created.children) == expected
+
+    uow = client.backend.begin()
+    try:
+        template = client.backend.get_resource_template("TreePerfOrderedPlate")
+        expanded = client.backend.create_resource(
+            "ordered-expanded", template, expand=True
+        )
+        assert list(expanded.children) == expected
+    finally:
+        uow.rollback()
+
+    plate = client.get_resource("ordered", "TreePerfOrderedPlate", expand=True)
+    assert list(plate.children) == expected
+
+    qm = client.query_maker(unscoped=True)
+    tree = qm.resources(load="full").filter(name="ordered").first()
+    assert list(tree.children) == expected
@@ -1,22 +1,34 @@
+import subprocess
+import sys
 from datetime import UTC, datetime
 from uuid import uuid4
 
 import pytest
+from pydantic import ValidationError
 
 from recap.schemas.attribute import (
     AttributeGroupTemplateSchema,
     AttributeTemplateSchema,
     AttributeTemplateValidator,
+    coerce_value,
 )
 from recap.schemas.common import Attribute, ValueType
-from recap.schemas.resource import PropertySchema
+from recap.schemas.resource import (
+    PropertySchema,
+    ResourceSlotSchema,
+    ResourceTypeSchema,
+)
 from recap.schemas.step import ParameterSchema
+from recap.utils.general import Direction
 
-
-def _now():
-    return datetime.now(UTC)
+# Timestamps are irrelevant to these tests; one fixed value keeps them
+# deterministic.
+STAMP = datetime(2024, 1, 1, tzinfo=UTC)
 
 
+# The template helpers use model_construct, as the backend hydrators do:
+# their inputs are literal test constants, and the schemas under test
+# (ParameterSchema, PropertySchema) validate values against them anyway.
 def _attribute_template_schema(
     name: str,
     value_type: str,
@@ -24,11 +36,10 @@ def _attribute_template_schema(
     unit: str | None = None,
     metadata: dict | None = None,
 ):
-    stamp = _now()
-    return AttributeTemplateSchema(
+    return AttributeTemplateSchema.model_construct(
         id=uuid4(),
-        create_date=stamp,
-        modified_date=stamp,
+        create_date=STAMP,
+        modified_date=STAMP,
         name=name,
         slug=name.lower(),
         value_type=value_type,
@@ -39,17 +50,25 @@ def _attribute_template_schema(
 
 
 def _attribute_group_schema(name: str, templates: list[AttributeTemplateSchema]):
-    stamp = _now()
-    return AttributeGroupTemplateSchema(
+    return AttributeGroupTemplateSchema.model_construct(
         id=uuid4(),
-        create_date=stamp,
-        modified_date=stamp,
+        create_date=STAMP,
+        modified_date=STAMP,
         name=name,
         slug=name.lower(),
         attribute_templates=templates,
     )
 
 
+@pytest.fixture(scope="module")
+def inputs_group():
+    """The ``Inputs`` group (Voltage int, Enabled bool) shared by the parameter
+    schema tests. Tests build parameters from it but never mutate it."""
+    voltage = _attribute_template_schema("Voltage", "int", 5)
+    enabled = _attribute_template_schema("Enabled", "bool", False)
+    return _attribute_group_schema("Inputs", [voltage, enabled])
+
+
 def test_attribute_schema_validates_default_value_type():
     Attribute(
         name="count",
@@ -64,6 +83,19 @@ def test_attribute_schema_validates_default_value_type():
             value_type=ValueType.INT,
             default_value="ten",
         )
+    with pytest.raises(ValueError):
+        Attribute(
+            name="count",
+            slug="count",
+            value_type=ValueType.INT,
+            default_value=True,
+        )
+    Attribute(
+        name="ratio",
+        slug="ratio",
+        value_type=ValueType.FLOAT,
+        default_value=1,
+    )
 
 
 def test_attribute_template_validator_coerces_and_rejects_defaults():
@@ -74,43 +106,98 @@ def test_attribute_template_validator_coerces_and_rejects_defaults():
         AttributeTemplateValidator(name="When", type="datetime", default="not-a-date")
 
 
-def test_parameter_schema_coerces_values_and_rejects_unknown():
+def test_coerce_value_matches_validator_rules():
+    assert coerce_value("int", "7") == 7
+    assert coerce_value("bool", "no") is False
+    assert coerce_value("enum", "u", {"choices": {"u": {}, "d": {}}}) == "u"
+
+    with pytest.raises(ValueError):
+        coerce_value("int", "seven")
+    with pytest.raises(ValueError):
+        coerce_value("enum", "x", {"choices": {"u": {}}})
+    with pytest.raises(ValueError):
+        coerce_value("complex", 1)
+
+
+def test_attribute_group_by_name_is_built_once():
     voltage = _attribute_template_schema("Voltage", "int", 5)
-    enabled = _attribute_template_schema("Enabled", "bool", False)
-    group_schema = _attribute_group_schema("Inputs", [voltage, enabled])
-    stamp = _now()
+    group_schema = _attribute_group_schema("Inputs", [voltage])
+
+    by_name = group_schema.by_name()
+    assert by_name == {"Voltage": voltage}
+    assert group_schema.by_name() is by_name
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [
+        ({"Voltage": "10", "Enabled": "true"}, (10, True)),
+        ({"Voltage": "0", "Enabled": "false"}, (0, False)),
+    ],
+)
+def test_parameter_schema_coerces_values(inputs_group, raw, expected):
     schema = ParameterSchema(
         id=uuid4(),
-        create_date=stamp,
-        modified_date=stamp,
-        template=group_schema,
-        values={"Voltage": "10", "Enabled": "true"},
+        create_date=STAMP,
+        modified_date=STAMP,
+        template=inputs_group,
+        values=raw,
     )
 
-    assert schema.values.voltage.value == 10
-    assert schema.values.enabled.value is True
+    voltage, enabled = schema.values.voltage.value, schema.values.enabled.value
+    assert type(voltage) is int and voltage == expected[0]
+    assert enabled is expected[1]
+
 
+def test_parameter_schema_rejects_unknown_values(inputs_group):
     with pytest.raises(ValueError):
         ParameterSchema(
             id=uuid4(),
-            create_date=stamp,
-            modified_date=stamp,
-            template=group_schema,
+            create_date=STAMP,
+            modified_date=STAMP,
+            template=inputs_group,
             values={"Voltage": "5", "Unknown": 1},
         )
 
 
-def test_parameter_schema_exposes_typed_values_model():
-    voltage = _attribute_template_schema("Voltage", "int", 5)
-    enabled = _attribute_template_schema("Enabled", "bool", False)
-    group_schema = _attribute_group_schema("Inputs", [voltage, enabled])
-    stamp = _now()
+@pytest.mark.parametrize(
+    ("schema_cls", "label"),
+    [(ParameterSchema, "parameter"), (PropertySchema, "property")],
+)
+def test_unknown_key_reported_before_coercion_errors(schema_cls, label, inputs_group):
+    # Values carried over from another group reach the after-validator
+    # directly: "Voltage" is a bad int for Inputs and "Extra" is unknown.
+    other = _attribute_group_schema(
+        "Other",
+        [
+            _attribute_template_schema("Voltage", "str", "x"),
+            _attribute_template_schema("Extra", "int", 0),
+        ],
+    )
+    source = schema_cls(
+        id=uuid4(),
+        create_date=STAMP,
+        modified_date=STAMP,
+        template=other,
+        values={"Voltage": "bad", "Extra": 1},
+    )
 
+    with pytest.raises(ValueError, match=rf"Unknown {label}\(s\) .*: Extra"):
+        schema_cls(
+            id=uuid4(),
+            create_date=STAMP,
+            modified_date=STAMP,
+            template=inputs_group,
+            values=source.values,
+        )
+
+
+def test_parameter_schema_exposes_typed_values_model(inputs_group):
     schema = ParameterSchema(
         id=uuid4(),
-        create_date=stamp,
-        modified_date=stamp,
-        template=group_schema,
+        create_date=STAMP,
+        modified_date=STAMP,
+        template=inputs_group,
         values={"Voltage": "10", "Enabled": "true"},
     )
 
@@ -121,29 +208,39 @@ def test_parameter_schema_exposes_typed_values_model():
     assert schema["Enabled"].value is True
 
 
-def test_property_schema_value_coercion_matches_template():
-    temperature = _attribute_template_schema("Temp", "float", 37.5)
-    group_schema = _attribute_group_schema("Environment", [temperature])
-    stamp = _now()
+@pytest.mark.parametrize(
+    ("value_type", "default", "raw", "expected"),
+    [
+        ("float", 37.5, "25.5", 25.5),
+        ("int", 5, "7", 7),
+        ("bool", False, "yes", True),
+    ],
+)
+def test_property_schema_value_coercion_matches_template(
+    value_type, default, raw, expected
+):
+    reading = _attribute_template_schema("Reading", value_type, default)
+    group_schema = _attribute_group_schema("Environment", [reading])
     property_schema = PropertySchema(
         id=uuid4(),
-        create_date=stamp,
-        modified_date=stamp,
+        create_date=STAMP,
+        modified_date=STAMP,
         template=group_schema,
-        values={"Temp": "25.5"},
+        values={"Reading": raw},
     )
 
-    assert property_schema.temp.value == pytest.approx(25.5)
+    value = property_schema.reading.value
+    assert type(value) is type(expected)
+    assert value == expected
 
 
 def test_property_schema_shortcut_attribute_access():
     temperature = _attribute_template_schema("Temp", "float", 37.5)
     group_schema = _attribute_group_schema("Environment", [temperature])
-    stamp = _now()
     property_schema = PropertySchema(
         id=uuid4(),
-        create_date=stamp,
-        modified_date=stamp,
+        create_date=STAMP,
+        modified_date=STAMP,
         template=group_schema,
         values={"Temp": "25.5"},
     )
@@ -175,18 +272,14 @@ def test_property_schema_shortcut_attribute_access():
     assert property_schema.template is group_schema
 
 
-def test_parameter_schema_shortcut_attribute_access():
-    voltage = _attribute_template_schema("Voltage", "int", 5)
-    enabled = _attribute_template_schema("Enabled", "bool", False)
-    group_schema = _attribute_group_schema("Inputs", [voltage, enabled])
-    stamp = _now()
+def test_parameter_schema_shortcut_attribute_access(inputs_group):
     from recap.schemas.step import ParameterSchema as PS
 
     schema = PS(
         id=uuid4(),
-        create_date=stamp,
-        modified_date=stamp,
-        template=group_schema,
+        create_date=STAMP,
+        modified_date=STAMP,
+        template=inputs_group,
         values={"Voltage": "10", "Enabled": "true"},
     )
 
@@ -215,17 +308,16 @@ def test_parameter_schema_shortcut_attribute_access():
         _ = schema.nonexistent_field
 
     # Real ParameterSchema fields are unaffected
-    assert schema.template is group_schema
+    assert schema.template is inputs_group
 
 
 def test_property_schema_bracket_assignment_preserves_unit():
     volume = _attribute_template_schema("Volume", "float", 10.0, unit="uL")
     group_schema = _attribute_group_schema("Content", [volume])
-    stamp = _now()
     prop = PropertySchema(
         id=uuid4(),
-        create_date=stamp,
-        modified_date=stamp,
+        create_date=STAMP,
+        modified_date=STAMP,
         template=group_schema,
         values={"Volume": 10.0},
     )
@@ -247,13 +339,12 @@ def test_property_schema_bracket_assignment_preserves_unit():
 def test_parameter_schema_bracket_assignment_preserves_unit():
     volume = _attribute_template_schema("Volume", "float", 25.0, unit="nL")
     group_schema = _attribute_group_schema("Echo", [volume])
-    stamp = _now()
     from recap.schemas.step import ParameterSchema as PS
 
     param = PS(
         id=uuid4(),
-        create_date=stamp,
-        modified_date=stamp,
+        create_date=STAMP,
+        modified_date=STAMP,
         template=group_schema,
         values={"Volume": 25.0},
     )
@@ -275,11 +366,10 @@ def test_parameter_schema_bracket_assignment_preserves_unit():
 def test_property_schema_value_assignment_preserves_overridden_unit():
     volume = _attribute_template_schema("Volume", "float", 10.0, unit="uL")
     group_schema = _attribute_group_schema("Content", [volume])
-    stamp = _now()
     prop = PropertySchema(
         id=uuid4(),
-        create_date=stamp,
-        modified_date=stamp,
+        create_date=STAMP,
+        modified_date=STAMP,
         template=group_schema,
         values={"Volume": 10.0},
     )
@@ -300,12 +390,11 @@ def test_property_schema_value_assignment_preserves_overridden_unit():
 def test_parameter_schema_rejects_uncoercible_values():
     duration = _attribute_template_schema("Duration", "int", 0)
     group_schema = _attribute_group_schema("Timing", [duration])
-    stamp = _now()
     with pytest.raises(ValueError):
         ParameterSchema(
             id=uuid4(),
-            create_date=stamp,
-            modified_date=stamp,
+            create_date=STAMP,
+            modified_date=STAMP,
             template=group_schema,
             values={"Duration": "not-an-int"},
         )
@@ -316,13 +405,12 @@ def test_parameter_schema_respects_metadata_bounds():
         "Voltage", "int", 5, metadata={"min": 0, "max": 10}
     )
     group_schema = _attribute_group_schema("Inputs", [voltage])
-    stamp = _now()
 
     with pytest.raises(ValueError):
         ParameterSchema(
             id=uuid4(),
-            create_date=stamp,
-            modified_date=stamp,
+            create_date=STAMP,
+            modified_date=STAMP,
             template=group_schema,
             values={"Voltage": 11},
         )
@@ -336,12 +424,11 @@ def test_enum_attribute_validates_choices():
         metadata={"choices": {"u": {"x": 0, "y": 1}, "d": {"x": 0, "y": -1}}},
     )
     group_schema = _attribute_group_schema("Positions", [drop])
-    stamp = _now()
 
     schema = ParameterSchema(
         id=uuid4(),
-        create_date=stamp,
-        modified_date=stamp,
+        create_date=STAMP,
+        modified_date=STAMP,
         template=group_schema,
         values={"Drop Position": "d"},
     )
@@ -350,8 +437,41 @@ def test_enum_attribute_validates_choices():
     with pytest.raises(ValueError):
         ParameterSchema(
             id=uuid4(),
-            create_date=stamp,
-            modified_date=stamp,
+            create_date=STAMP,
+            modified_date=STAMP,
             template=group_schema,
             values={"Drop Position": "x"},
         )
+
+
+def test_schemas_defer_build_until_warmup():
+    # Run in a fresh interpreter: other tests in this session have already
+    # built these schemas.
+    script = (
+        "from recap.schemas.process import ProcessRunSchema, warmup_schemas\n"
+        "from recap.schemas.step import StepSchema\n"
+        "assert not StepSchema.__pydantic_complete__\n"
+        "assert not ProcessRunSchema.__pydantic_complete__\n"
+        "warmup_schemas()\n"
+        "assert StepSchema.__pydantic_complete__\n"
+        "assert ProcessRunSchema.__pydantic_complete__\n"
+    )
+    subprocess.run([sys.executable, "-c", script], check=True)
+
+
+def test_slot_and_type_schemas_are_frozen_and_hashable():
+    container = ResourceTypeSchema(
+        id=uuid4(), create_date=STAMP, modified_date=STAMP, name="container"
+    )
+    slot = ResourceSlotSchema(
+        id=uuid4(),
+        create_date=STAMP,
+        modified_date=STAMP,
+        name="plate",
+        resource_type=container,
+        direction=Direction.input,
+    )
+
+    with pytest.raises(ValidationError):
+        slot.name = "other"
+    assert len({slot, slot.model_copy()}) == 1
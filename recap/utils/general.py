@@ -1,6 +1,9 @@
 import enum
 import json
 from datetime import datetime
+from functools import cache, lru_cache
+from itertools import chain, count, islice, product
+from string import ascii_uppercase
 from typing import Any
 
 from slugify import slugify
@@ -129,26 +132,33 @@ def from_json_value(value_type: str, value: Any) -> Any:
     return coerced
 
 
+@cache
+def _uppercase_alphabets(n: int) -> tuple[str, ...]:
+    # Spreadsheet-style labels: A..Z, then AA..ZZ, then AAA.., i.e. every
+    # width's letter combinations in order.
+    labels = chain.from_iterable(
+        product(ascii_uppercase, repeat=width) for width in count(1)
+    )
+    return tuple("".join(label) for label in islice(labels, n))
+
+
 def generate_uppercase_alphabets(n: int) -> list:
     if n < 1:
         raise ValueError("The number must be a positive integer.")
-
-    alphabets = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
-
-    def get_letter(num):
-        result = []
-        while num > 0:
-            num, remainder = divmod(num - 1, 26)
-            result.append(alphabets[remainder])
-        return "".join(reversed(result))
-
-    return [get_letter(i) for i in range(1, n + 1)]
+    # The labels are memoised as a tuple; hand out a fresh list each call
+    return list(_uppercase_alphabets(n))
 
 
+# Slugs are derived from a small, heavily repeated set of names (attribute,
+# group and template names), and slugify's normalisation is comparatively slow.
+@lru_cache(maxsize=4096)
 def make_slug(value: str) -> str:
     """
     Generate a slug that is always a valid Python identifier.
     """
+    # Names that are already lowercase ASCII identifiers slugify to themselves
+    if value.isascii() and value.isidentifier() and value.islower():
+        return value
     regex_pattern = r"[^a-z0-9_]+"  # allow only lowercase letters, digits, underscores
     slug = slugify(
         value,